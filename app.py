@@ -6,10 +6,14 @@ from project.visualisation_2.src.app import get_viz_2_html
 from project.visualisation_3.app import get_viz_3_html
 from project.visualisation_4.app import get_viz_4_html
 from project.visualisation_5.app import get_viz_5_html
+from project import figure_assets
+from project import metrics
 
 app = dash.Dash(__name__)
 server = app.server 
 app.title = "Projet INF8808"
+figure_assets.init_app(server)
+metrics.init_app(server)
 
 app.layout = html.Div([
     html.Main([
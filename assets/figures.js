@@ -0,0 +1,27 @@
+// Chargement clientside des variantes de figures (voir project/figure_assets.py).
+// Les figures sont téléchargées une seule fois depuis /figures/<nom>.json puis gardées
+// en mémoire : changer de saison n'envoie plus aucune requête au serveur Dash.
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    figures: {
+        // Requêtes déjà lancées, indexées par nom de variante
+        cache: {},
+
+        // Retourne la figure `name`, ou no_update tant que la section n'est pas visible
+        load: function (visible, name) {
+            if (!visible) {
+                return window.dash_clientside.no_update;
+            }
+            const cache = window.dash_clientside.figures.cache;
+            if (!cache[name]) {
+                cache[name] = fetch("/figures/" + encodeURIComponent(name) + ".json").then(function (response) {
+                    if (!response.ok) {
+                        delete cache[name];  // Permet de réessayer au prochain changement
+                        throw new Error("Figure introuvable : " + name);
+                    }
+                    return response.json();
+                });
+            }
+            return cache[name];
+        }
+    }
+});
@@ -0,0 +1,45 @@
+// Chargement différé des visualisations.
+// Chaque section "vizN-section" contient un dcc.Store "vizN-visible" : dès que la
+// section approche de la zone visible, le store passe à true, ce qui déclenche les
+// callbacks qui construisent ses figures. Les figures ne sont donc calculées et
+// envoyées au navigateur que pour les sections réellement consultées.
+(function () {
+    // Sections de la page (chacune associée au store "vizN-visible")
+    const SECTION_IDS = ["viz1-section", "viz2-section", "viz3-section", "viz4-section", "viz5-section"];
+    const observed = new Set();  // Identifiants des sections déjà surveillées
+
+    // Marque une section comme visible (une seule fois) et arrête de la surveiller
+    const observer = new IntersectionObserver(function (entries) {
+        entries.forEach(function (entry) {
+            if (!entry.isIntersecting || !window.dash_clientside || !window.dash_clientside.set_props) {
+                return;
+            }
+            const storeId = entry.target.id.replace(/-section$/, "-visible");
+            window.dash_clientside.set_props(storeId, {data: true});
+            observer.unobserve(entry.target);
+        });
+    }, {rootMargin: "300px 0px"});  // Commence le chargement un peu avant que la section soit à l'écran
+
+    // Surveille les sections présentes dans la page ; retourne true quand toutes le sont
+    function observeSections() {
+        SECTION_IDS.forEach(function (id) {
+            const section = document.getElementById(id);
+            if (section && !observed.has(id)) {
+                observed.add(id);
+                observer.observe(section);
+            }
+        });
+        return observed.size === SECTION_IDS.length;
+    }
+
+    // La mise en page Dash est rendue après le chargement du script : on attend l'apparition
+    // des sections, puis on cesse d'observer le DOM (les redessins Plotly ne sont pas concernés)
+    const mutations = new MutationObserver(function () {
+        if (observeSections()) {
+            mutations.disconnect();
+        }
+    });
+    if (!observeSections()) {
+        mutations.observe(document.documentElement, {childList: true, subtree: true});
+    }
+})();
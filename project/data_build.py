@@ -0,0 +1,739 @@
+"""
+Construction hors ligne de toutes les données dérivées utilisées par l'application.
+
+Une seule commande lit all_athlete_games.csv une fois (via project.data_store) et
+produit chaque artefact : tables Parquet typées, cube des médailles, clés des pays, tables des
+athlètes, des pays, des top 10 et des disciplines (visualisation 4, rangées dans
+'data/derived' avec leur manifeste) et données prétraitées de la visualisation 2.
+
+Les étapes forment un graphe de dépendances (voir BUILD_STEPS). La clé d'une étape
+est l'empreinte du contenu de ses fichiers sources et des clés des étapes dont
+elle dépend : une étape dont la clé n'a pas changé depuis la dernière construction
+(voir le manifeste dans 'data/artifacts') est sautée. Chaque table typée est
+une étape distincte : modifier une table ne reconstruit que les étapes qui la
+lisent. Les étapes indépendantes sont exécutées en parallèle.
+
+Utilisation (depuis la racine du projet) :
+    python -m project.data_build            # Reconstruit uniquement ce qui a changé
+    python -m project.data_build --force    # Reconstruit tout
+    python -m project.data_build --append nouvelle_edition.csv  # Ajoute une édition
+"""
+
+# Importation des bibliothèques nécessaires
+import argparse  # Pour lire les options de la ligne de commande
+import functools  # Pour associer chaque étape typée à sa table
+import hashlib  # Pour calculer l'empreinte du contenu des fichiers sources
+import json  # Pour lire et écrire le manifeste de construction
+import logging  # Pour afficher les chargements des tables pendant la construction
+import re  # Pour normaliser les noms des athlètes
+import time  # Pour mesurer la durée de chaque étape
+from concurrent.futures import ThreadPoolExecutor  # Pour exécuter les étapes indépendantes en parallèle
+
+import pandas as pd  # Pour manipuler les données sous forme de DataFrame
+import pyarrow.parquet as pq  # Pour compter les lignes des partitions sans les lire
+
+from project import data_store  # Schémas des tables et emplacement des artefacts
+
+SEASONS = ["Summer", "Winter"]  # Saisons des tables par saison
+MEDAL_COLUMNS = {"Gold": "or", "Silver": "argent", "Bronze": "bronze"}  # Colonnes des tables des pays
+TOP_COUNTRIES = 10  # Nombre de pays retenus dans les tables top10_pays_*
+TOP_ATHLETES_PER_COUNTRY = 10  # Nombre d'athlètes retenus par pays dans les tables top10_athletes_*
+MIN_ATHLETE_MEDALS = 5  # Les athlètes ayant au moins ce nombre de médailles sont toujours retenus
+
+OUTPUT_FOLDER = data_store.DERIVED_FOLDER  # Dossier unique des tables dérivées (CSV)
+VIZ2_FOLDER = data_store.DATA_FOLDER.parent / "project" / "visualisation_2" / "src"  # Données prétraitées de la visualisation 2
+MANIFEST_FILE = data_store.ARTIFACTS_FOLDER / "build_manifest.json"  # Clés des étapes déjà construites
+BREAKDOWN_ARTIFACT = "medal_breakdown"  # Détail des médailles par athlète, saison et discipline
+NICKNAME_PATTERN = re.compile(r'"[^"]*"')  # Surnoms entre guillemets ("Jenny")
+NAME_SUFFIX_PATTERN = re.compile(r",?\s+(?:Jr|Sr|II|III|IV)\.?$")  # Suffixes générationnels (", Jr.", ", II"...)
+
+
+def build_typed_artifact(filename):
+    """
+    Convertit un fichier CSV du dossier 'data' en artefact Parquet typé.
+    Retourne le chemin de l'artefact créé, ou None si le CSV source est absent.
+    """
+    source = data_store.DATA_FOLDER / filename
+    if not source.exists():
+        print(f"Fichier source absent, ignoré : {source}")
+        return None
+
+    start = time.perf_counter()
+    df = data_store.read_csv_typed(filename)  # Lecture avec le schéma de la table
+
+    artifact = data_store.get_artifact_path(filename)
+    if filename in data_store.PARTITIONED_TABLES:
+        # Une partition par édition, pour pouvoir ajouter une édition sans réécrire les autres
+        artifact.mkdir(parents=True, exist_ok=True)
+        for stale in artifact.glob("*.parquet"):
+            stale.unlink()
+        for (year, season), edition in df.groupby(data_store.EDITION_KEYS, observed=True):
+            _write_partition(filename, year, season, edition)
+    else:
+        artifact.parent.mkdir(parents=True, exist_ok=True)
+        df.to_parquet(artifact, index=False)
+
+    elapsed = time.perf_counter() - start
+    print(f"Artefact créé : {artifact.name} ({len(df)} lignes, {elapsed:.2f} s)")
+    return artifact
+
+
+def _write_partition(filename, year, season, edition):
+    """
+    Enregistre la partition d'une édition. L'index (position des lignes dans le CSV)
+    est conservé pour que data_store.read_artifact retrouve l'ordre d'origine.
+    """
+    edition.to_parquet(data_store.get_partition_path(filename, year, season), index=True)
+
+
+def typed_step(filename):
+    """
+    Retourne le nom de l'étape construisant l'artefact typé d'une table
+    (par exemple 'all_athlete_games.csv' -> 'typed_all_athlete_games').
+    """
+    return "typed_" + filename.removesuffix(".csv").lower()
+
+
+def build_aggregate_artifacts():
+    """
+    Précalcule le cube des médailles et le résumé par pays et par édition à partir
+    de la table des participations, puis les enregistre dans 'data/artifacts'.
+    """
+    athletes = data_store.get_athlete_games()
+    aggregates = {
+        "medal_cube": data_store.compute_medal_cube,
+        "edition_summary": data_store.compute_edition_summary,
+    }
+
+    artifacts = []
+    for name, compute in aggregates.items():
+        start = time.perf_counter()
+        artifacts.append(_write_aggregate(name, compute(athletes), start))
+    return artifacts
+
+
+def _write_aggregate(name, df, start):
+    """
+    Enregistre une table agrégée dans 'data/artifacts' et affiche un résumé.
+    """
+    artifact = data_store.ARTIFACTS_FOLDER / f"{name}.parquet"
+    artifact.parent.mkdir(parents=True, exist_ok=True)
+    df.to_parquet(artifact, index=False)
+
+    elapsed = time.perf_counter() - start
+    print(f"Artefact créé : {artifact.name} ({len(df)} lignes, {elapsed:.2f} s)")
+    return artifact
+
+
+def build_country_keys():
+    """
+    Résout tous les codes NOC et noms de pays (alias compris) en identifiants entiers
+    (voir data_store.compute_country_keys) et enregistre la table dans 'data/artifacts'.
+    """
+    start = time.perf_counter()
+    keys = data_store.compute_country_keys(
+        data_store.load_table(data_store.REGIONS_FILE), data_store.load_table(data_store.COUNTRY_ALIASES_FILE)
+    )
+    return _write_aggregate("country_keys", keys, start)
+
+
+def normalize_name(full_name):
+    """
+    Retourne le nom affiché d'un athlète : son premier et son dernier mot, sans les
+    mentions entre parenthèses (par exemple les noms d'épouse), les surnoms entre
+    guillemets et les suffixes générationnels ("Michael Fred Phelps, II" -> "Michael Phelps").
+    """
+    name = NICKNAME_PATTERN.sub("", re.sub(r"\(.*?\)", "", full_name))
+    parts = NAME_SUFFIX_PATTERN.sub("", name.strip()).split()
+    if len(parts) > 1:
+        return f"{parts[0]} {parts[-1]}"
+    return parts[0] if parts else full_name
+
+
+def compute_athletes(medals):
+    """
+    Agrège les médailles par athlète, saison et discipline. Colonnes produites :
+      - nom, ID (plus petit Entry ID), pays (Team), discipline (Sport)
+      - année (première année médaillée), médaille (nombre de médailles), saison
+    """
+    athletes = (
+        medals.groupby(["Name", "Season", "Sport"], observed=True)
+        .agg({"Entry ID": "min", "Team": "first", "Year": "min", "Medal": "count"})
+        .reset_index()
+        .rename(columns={
+            "Name": "nom",
+            "Entry ID": "ID",
+            "Team": "pays",
+            "Sport": "discipline",
+            "Year": "année",
+            "Medal": "médaille",
+            "Season": "saison",
+        })
+    )
+    return athletes[["nom", "ID", "pays", "discipline", "année", "médaille", "saison"]]
+
+
+def compute_countries(medals):
+    """
+    Compte les médailles d'or, d'argent et de bronze de chaque pays (Team), avec
+    le total et le score (or = 3 pts / argent = 2 pts / bronze = 1 pt), trié par score.
+    """
+    counts = (
+        medals.groupby(["Team", "Medal"], observed=True)
+        .size()
+        .unstack(fill_value=0)
+        .reindex(columns=list(MEDAL_COLUMNS), fill_value=0)
+        .rename(columns=MEDAL_COLUMNS)
+    )
+    counts["total_medals"] = counts["or"] + counts["argent"] + counts["bronze"]
+    counts["score"] = counts["or"] * 3 + counts["argent"] * 2 + counts["bronze"] * 1
+
+    counts = counts.reset_index().rename(columns={"Team": "pays"})
+    counts["pays"] = counts["pays"].astype(str)
+    return counts.sort_values("score", ascending=False)
+
+
+def top_athletes_by_country(
+    athletes,
+    top_countries,
+    breakdown,
+    top_athletes_per_country=TOP_ATHLETES_PER_COUNTRY,
+    min_medals=MIN_ATHLETE_MEDALS,
+):
+    """
+    Pour chaque pays de `top_countries` (et chaque saison présente dans `athletes`),
+    sélectionne la réunion des `top_athletes_per_country` athlètes ayant le plus de
+    médailles et de tous les athlètes ayant au moins `min_medals` médailles, puis
+    ajoute le nom affiché (nom_norm) et le détail des médailles (gold, silver, bronze).
+
+    La sélection se fait en une passe : rang des athlètes dans chaque pays (ex æquo
+    départagés par l'ordre de la table), filtre, puis une seule fusion avec `breakdown`.
+    Les lignes sont triées dans l'ordre de `top_countries`, puis par rang.
+    """
+    country_order = {country: position for position, country in enumerate(top_countries)}
+    selected = athletes[athletes["pays"].isin(country_order)]
+
+    # Rang de chaque athlète dans son pays, par nombre de médailles décroissant
+    rank = selected.groupby(["saison", "pays"], sort=False)["médaille"].rank(method="first", ascending=False)
+    keep = (rank <= top_athletes_per_country) | (selected["médaille"] >= min_medals)
+
+    top = (
+        selected.assign(_pays_order=selected["pays"].map(country_order), _rank=rank)[keep]
+        .sort_values(["_pays_order", "saison", "_rank"], kind="stable")
+        .drop(columns=["_pays_order", "_rank"])
+        .merge(breakdown, on=["nom", "saison", "discipline"], how="left")  # Détail des médailles
+    )
+    for col in ["gold", "silver", "bronze"]:
+        top[col] = top[col].fillna(0).astype(int)
+    top.insert(1, "nom_norm", top["nom"].map(normalize_name))
+    return top
+
+
+def compute_disciplines(top_athletes):
+    """
+    Compte le nombre d'apparitions de chaque discipline dans une table top10_athletes_*.
+    """
+    disciplines = top_athletes["discipline"].value_counts().reset_index()
+    disciplines.columns = ["discipline", "count"]
+    return disciplines
+
+
+def _season_files(prefix):
+    """
+    Retourne les chemins des tables par saison (par exemple pays_summer.csv et pays_winter.csv).
+    """
+    return [OUTPUT_FOLDER / f"{prefix}_{season.lower()}.csv" for season in SEASONS]
+
+
+def _write_csv(df, path):
+    """
+    Écrit une table dérivée en CSV et affiche un résumé.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    df.to_csv(path, index=False)
+    print(f"Fichier créé : {path.name} ({len(df)} lignes)")
+
+
+def _read_output(path):
+    """
+    Relit une table produite par une étape précédente.
+    """
+    return pd.read_csv(path)
+
+
+def build_athletes():
+    """
+    Construit athletes_summer.csv et athletes_winter.csv.
+    """
+    athletes = compute_athletes(data_store.get_medal_rows(data_store.get_athlete_games()))
+    for season, path in zip(SEASONS, _season_files("athletes")):
+        _write_csv(athletes[athletes["saison"] == season], path)
+
+
+def build_countries():
+    """
+    Construit pays_summer.csv et pays_winter.csv.
+    """
+    medals = data_store.get_medal_rows(data_store.get_athlete_games())
+    for season, path in zip(SEASONS, _season_files("pays")):
+        _write_csv(compute_countries(medals[medals["Season"] == season]), path)
+
+
+def build_top_countries():
+    """
+    Construit top10_pays_summer.csv et top10_pays_winter.csv (les TOP_COUNTRIES premiers pays par score).
+    """
+    for source, path in zip(_season_files("pays"), _season_files("top10_pays")):
+        _write_csv(_read_output(source).head(TOP_COUNTRIES), path)
+
+
+def build_medal_breakdown():
+    """
+    Construit l'artefact du détail des médailles par athlète (medal_breakdown.parquet).
+    """
+    start = time.perf_counter()
+    medals = data_store.get_medal_rows(data_store.get_athlete_games())
+    _write_aggregate(BREAKDOWN_ARTIFACT, data_store.compute_medal_breakdown(medals), start)
+
+
+def build_top_athletes():
+    """
+    Construit top10_athletes_summer.csv et top10_athletes_winter.csv.
+    """
+    breakdown = pd.read_parquet(data_store.ARTIFACTS_FOLDER / f"{BREAKDOWN_ARTIFACT}.parquet")
+    for athletes_file, countries_file, path in zip(
+        _season_files("athletes"), _season_files("top10_pays"), _season_files("top10_athletes")
+    ):
+        top_countries = _read_output(countries_file)["pays"].tolist()
+        _write_csv(top_athletes_by_country(_read_output(athletes_file), top_countries, breakdown), path)
+
+
+def build_disciplines():
+    """
+    Construit disciplines_summer.csv et disciplines_winter.csv.
+    """
+    for source, path in zip(_season_files("top10_athletes"), _season_files("disciplines")):
+        _write_csv(compute_disciplines(_read_output(source)), path)
+
+
+def build_viz2_data():
+    """
+    Construit les données prétraitées de la visualisation 2 (médailles vs PIB).
+    """
+    # Importation locale : le module de la visualisation 2 n'est utile qu'à cette étape
+    import project.visualisation_2.src.preprocess as viz2_preprocess
+
+    for graph_id in (1, 2):
+        _write_csv(viz2_preprocess.generate_data_medals_vs_pib(graph_id), VIZ2_FOLDER / f"vis_2_processed_data_{graph_id}.csv")
+
+
+# Graphe des étapes de construction :
+#   - sources : fichiers du dossier 'data' lus par l'étape (leur contenu forme la clé de l'étape)
+#   - depends : étapes devant être terminées avant celle-ci
+#   - run : fonction de construction
+BUILD_STEPS = {
+    # Une étape par table typée : sa clé ne dépend que de son propre fichier CSV
+    **{
+        typed_step(filename): {
+            "sources": [filename],
+            "depends": [],
+            "run": functools.partial(build_typed_artifact, filename),
+        }
+        for filename in data_store.TABLE_SCHEMAS
+    },
+    "aggregates": {
+        "sources": [data_store.ATHLETE_GAMES_FILE],
+        "depends": [typed_step(data_store.ATHLETE_GAMES_FILE)],
+        "run": build_aggregate_artifacts,
+    },
+    "country_keys": {
+        "sources": [data_store.REGIONS_FILE, data_store.COUNTRY_ALIASES_FILE],
+        "depends": [typed_step(data_store.REGIONS_FILE), typed_step(data_store.COUNTRY_ALIASES_FILE)],
+        "run": build_country_keys,
+    },
+    "athletes": {
+        "sources": [data_store.ATHLETE_GAMES_FILE],
+        "depends": [typed_step(data_store.ATHLETE_GAMES_FILE)],
+        "run": build_athletes,
+    },
+    "countries": {
+        "sources": [data_store.ATHLETE_GAMES_FILE],
+        "depends": [typed_step(data_store.ATHLETE_GAMES_FILE)],
+        "run": build_countries,
+    },
+    "top_countries": {
+        "sources": [],
+        "depends": ["countries"],
+        "run": build_top_countries,
+    },
+    "medal_breakdown": {
+        "sources": [data_store.ATHLETE_GAMES_FILE],
+        "depends": [typed_step(data_store.ATHLETE_GAMES_FILE)],
+        "run": build_medal_breakdown,
+    },
+    "top_athletes": {
+        "sources": [],
+        "depends": ["athletes", "top_countries", "medal_breakdown"],
+        "run": build_top_athletes,
+    },
+    "disciplines": {
+        "sources": [],
+        "depends": ["top_athletes"],
+        "run": build_disciplines,
+    },
+    "viz2_data": {
+        # Le cube des médailles et les clés des pays couvrent les participations, les régions et les alias
+        "sources": ["WEO_database_Apre2024.csv"],
+        "depends": [
+            "aggregates",
+            "country_keys",
+            typed_step("countries_per_continent.csv"),
+            typed_step("SP_POP_TOTL.csv"),
+            typed_step("average_temperature_per_country.csv"),
+        ],
+        "run": build_viz2_data,
+    },
+}
+
+
+def _file_hash(path):
+    """
+    Retourne l'empreinte SHA-256 du contenu d'un fichier.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for block in iter(lambda: file.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _step_key(name, keys, file_hashes):
+    """
+    Calcule la clé d'une étape à partir du contenu de ses sources et des clés
+    des étapes dont elle dépend.
+    """
+    step = BUILD_STEPS[name]
+    digest = hashlib.sha256(name.encode("utf-8"))
+    for source in sorted(step["sources"]):
+        digest.update(f"{source}:{file_hashes[source]}".encode("utf-8"))
+    for dependency in sorted(step["depends"]):
+        digest.update(f"{dependency}:{keys[dependency]}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _file_hashes():
+    """
+    Retourne l'empreinte de chaque fichier source présent dans le dossier 'data'.
+    """
+    sources = {source for step in BUILD_STEPS.values() for source in step["sources"]}
+    return {
+        source: _file_hash(data_store.DATA_FOLDER / source)
+        for source in sources
+        if (data_store.DATA_FOLDER / source).exists()
+    }
+
+
+def _step_order():
+    """
+    Retourne les vagues d'étapes de BUILD_STEPS dans l'ordre de leurs dépendances :
+    les étapes d'une même vague sont indépendantes entre elles.
+    """
+    waves = []
+    done = set()
+    pending = dict(BUILD_STEPS)
+    while pending:
+        # Étapes dont toutes les dépendances sont traitées
+        ready = [name for name, step in pending.items() if all(dep in done for dep in step["depends"])]
+        if not ready:
+            raise ValueError(f"Dépendances circulaires entre les étapes : {sorted(pending)}")
+        for name in ready:
+            del pending[name]
+        done.update(ready)
+        waves.append(ready)
+    return waves
+
+
+def _step_keys(file_hashes):
+    """
+    Retourne la clé de chaque étape exécutable. Les étapes dont une source est
+    absente, ou qui dépendent d'une telle étape, n'ont pas de clé.
+    """
+    keys = {}
+    for wave in _step_order():
+        for name in wave:
+            step = BUILD_STEPS[name]
+            if all(source in file_hashes for source in step["sources"]) and all(dep in keys for dep in step["depends"]):
+                keys[name] = _step_key(name, keys, file_hashes)
+    return keys
+
+
+def write_derived_manifest():
+    """
+    Enregistre dans 'data/derived/manifest.json' l'empreinte de chaque table dérivée
+    et la version de l'ensemble (empreinte de toutes les tables). Le manifeste est
+    versionné avec les tables : toute modification de l'une d'elles change la version.
+    """
+    files = {path.name: _file_hash(path) for path in sorted(OUTPUT_FOLDER.glob("*.csv"))}
+    version = hashlib.sha256("".join(f"{name}:{digest}" for name, digest in files.items()).encode("utf-8"))
+    manifest = {"version": version.hexdigest(), "files": files}
+    (OUTPUT_FOLDER / "manifest.json").write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+    print(f"Version des tables dérivées : {manifest['version'][:12]}")
+    return manifest
+
+
+def _load_manifest():
+    """
+    Lit le manifeste de la dernière construction (clé de chaque étape construite).
+    """
+    if MANIFEST_FILE.exists():
+        return json.loads(MANIFEST_FILE.read_text(encoding="utf-8"))
+    return {}
+
+
+def _save_manifest(manifest):
+    """
+    Enregistre le manifeste de construction.
+    """
+    MANIFEST_FILE.parent.mkdir(parents=True, exist_ok=True)
+    MANIFEST_FILE.write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8")
+
+
+def _run_step(name):
+    """
+    Exécute une étape et retourne sa durée en secondes.
+    """
+    start = time.perf_counter()
+    BUILD_STEPS[name]["run"]()
+    return time.perf_counter() - start
+
+
+def build_all(force=False, max_workers=4):
+    """
+    Exécute les étapes de BUILD_STEPS dans l'ordre de leurs dépendances, en
+    parallèle lorsqu'elles sont indépendantes. Les étapes dont la clé est
+    inchangée depuis la dernière construction sont sautées (sauf si `force`),
+    de même que celles dont une source est absente, et leurs dépendantes.
+    Retourne le dictionnaire {étape: statut}.
+    """
+    file_hashes = _file_hashes()  # Empreinte de chaque fichier source présent
+    keys = _step_keys(file_hashes)  # Clé de chaque étape exécutable
+    manifest = _load_manifest()
+    status = {}  # Statut de chaque étape : "construite", "à jour" ou "ignorée"
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for wave in _step_order():
+            to_run = []
+            for name in wave:
+                step = BUILD_STEPS[name]
+                if name not in keys:
+                    missing = [source for source in step["sources"] if source not in file_hashes]
+                    skipped = [dep for dep in step["depends"] if status[dep] == "ignorée"]
+                    print(f"[{name}] ignorée : sources absentes {missing or skipped}")
+                    status[name] = "ignorée"
+                elif not force and manifest.get(name) == keys[name]:
+                    print(f"[{name}] à jour")
+                    status[name] = "à jour"
+                else:
+                    to_run.append(name)
+
+            # Les étapes d'une vague sont indépendantes entre elles : exécution en parallèle
+            for name, elapsed in zip(to_run, executor.map(_run_step, to_run)):
+                print(f"[{name}] construite en {elapsed:.2f} s")
+                status[name] = "construite"
+                manifest[name] = keys[name]
+                _save_manifest(manifest)
+
+    if "construite" in status.values():
+        write_derived_manifest()
+    return status
+
+
+def _existing_editions():
+    """
+    Retourne l'ensemble des éditions (année, saison) présentes dans l'artefact partitionné des participations.
+    """
+    editions = set()
+    for path in data_store._artifact_files(data_store.ATHLETE_GAMES_FILE):
+        year, season = path.stem.split("_", 1)
+        editions.add((int(year), season))
+    return editions
+
+
+def _partition_rows():
+    """
+    Retourne le nombre total de lignes des partitions des participations (sans les lire).
+    """
+    return sum(
+        pq.ParquetFile(path).metadata.num_rows
+        for path in data_store._artifact_files(data_store.ATHLETE_GAMES_FILE)
+    )
+
+
+def _append_rows(path, rows):
+    """
+    Ajoute des lignes à la fin d'un fichier CSV, sans réécrire son contenu.
+    """
+    with open(path, "rb") as file:
+        file.seek(0, 2)  # Fin du fichier
+        size = file.tell()
+        if size:
+            file.seek(size - 1)
+        ends_with_newline = not size or file.read(1) == b"\n"
+    with open(path, "a", encoding="utf-8", newline="") as file:
+        if not ends_with_newline:
+            file.write("\n")
+        rows.to_csv(file, index=False, header=False)
+
+
+def _merge_aggregate(name, new_rows, keys):
+    """
+    Ajoute à une table agrégée (cube des médailles ou résumé par édition) les lignes
+    d'une nouvelle édition. Les clés contenant l'année et la saison, les lignes des
+    éditions existantes ne changent pas : il suffit de concaténer puis de trier.
+    """
+    start = time.perf_counter()
+    current = pd.read_parquet(data_store.ARTIFACTS_FOLDER / f"{name}.parquet")
+    merged = pd.concat([current, new_rows], ignore_index=True)
+
+    # Les catégories diffèrent entre les deux tables : elles sont recalculées avant le tri
+    categories = [key for key in keys if isinstance(current[key].dtype, pd.CategoricalDtype)]
+    merged = merged.astype({key: "category" for key in categories})
+    merged = merged.sort_values(keys, kind="stable", ignore_index=True)
+    _write_aggregate(name, merged, start)
+
+
+def _merge_breakdown(new_breakdown):
+    """
+    Additionne le détail des médailles d'une nouvelle édition à l'artefact medal_breakdown.
+    """
+    start = time.perf_counter()
+    keys = ["nom", "saison", "discipline"]
+    current = pd.read_parquet(data_store.ARTIFACTS_FOLDER / f"{BREAKDOWN_ARTIFACT}.parquet")
+    merged = (
+        pd.concat([current, new_breakdown], ignore_index=True)
+        .groupby(keys, sort=True)[["gold", "silver", "bronze"]]
+        .sum()
+        .reset_index()
+    )
+    _write_aggregate(BREAKDOWN_ARTIFACT, merged, start)
+
+
+def _merge_athletes(new_athletes):
+    """
+    Ajoute les médailles d'une nouvelle édition aux tables athletes_* : les athlètes
+    existants gardent leur pays et leur première année, leur nombre de médailles est additionné.
+    """
+    keys = ["nom", "saison", "discipline"]
+    for season, path in zip(SEASONS, _season_files("athletes")):
+        merged = (
+            pd.concat([_read_output(path), new_athletes[new_athletes["saison"] == season]], ignore_index=True)
+            .groupby(keys, sort=True)
+            .agg({"ID": "min", "pays": "first", "année": "min", "médaille": "sum"})
+            .reset_index()
+        )
+        _write_csv(merged[["nom", "ID", "pays", "discipline", "année", "médaille", "saison"]], path)
+
+
+def _merge_countries(medals):
+    """
+    Ajoute les médailles d'une nouvelle édition aux tables pays_*, puis recalcule
+    le total, le score et le classement.
+    """
+    for season, path in zip(SEASONS, _season_files("pays")):
+        season_medals = medals[medals["Season"] == season]
+        if season_medals.empty:
+            continue
+        new_counts = compute_countries(season_medals)
+        merged = (
+            pd.concat([_read_output(path), new_counts], ignore_index=True)
+            .groupby("pays", sort=True)[list(MEDAL_COLUMNS.values())]
+            .sum()
+        )
+        merged["total_medals"] = merged["or"] + merged["argent"] + merged["bronze"]
+        merged["score"] = merged["or"] * 3 + merged["argent"] * 2 + merged["bronze"] * 1
+        _write_csv(merged.reset_index().sort_values("score", ascending=False), path)
+
+
+def append_edition(path):
+    """
+    Ajoute une nouvelle édition des Jeux sans tout recalculer.
+
+    Le fichier `path` contient les participations de la nouvelle édition, avec les
+    mêmes colonnes que all_athlete_games.csv. Ses lignes sont ajoutées à la fin du
+    CSV, seule la partition de l'édition est écrite, et les tables dérivées sont
+    mises à jour en ajoutant les agrégats des nouvelles lignes aux tables existantes.
+    Les tables top 10 et des disciplines, petites, sont recalculées à partir de
+    celles-ci. La construction complète doit avoir été faite au préalable.
+    Retourne la liste des éditions ajoutées.
+    """
+    source = data_store.DATA_FOLDER / data_store.ATHLETE_GAMES_FILE
+    if not _existing_editions():
+        raise ValueError("Aucune partition existante : lancer d'abord la construction complète.")
+
+    # Lecture des nouvelles lignes avec le schéma de la table des participations
+    columns = pd.read_csv(source, nrows=0).columns.tolist()
+    new_rows = pd.read_csv(path, **data_store.TABLE_SCHEMAS[data_store.ATHLETE_GAMES_FILE])
+    if sorted(new_rows.columns) != sorted(columns):
+        raise ValueError(f"Colonnes inattendues dans {path} : {new_rows.columns.tolist()} (attendues : {columns})")
+    new_rows = new_rows[columns]
+
+    # Refuse les éditions déjà présentes (elles seraient comptées deux fois)
+    editions = sorted(new_rows.groupby(data_store.EDITION_KEYS, observed=True).groups)
+    duplicates = [edition for edition in editions if edition in _existing_editions()]
+    if duplicates:
+        raise ValueError(f"Éditions déjà présentes : {duplicates}")
+
+    file_hashes = _file_hashes()
+    manifest = _load_manifest()
+    up_to_date = {name for name, key in _step_keys(file_hashes).items() if manifest.get(name) == key}
+
+    # Ajout au CSV puis écriture des seules nouvelles partitions (index = position dans le CSV)
+    first_row = _partition_rows()
+    new_rows.index = pd.RangeIndex(first_row, first_row + len(new_rows))
+    _append_rows(source, new_rows)
+    for (year, season), edition in new_rows.groupby(data_store.EDITION_KEYS, observed=True):
+        _write_partition(data_store.ATHLETE_GAMES_FILE, year, season, edition)
+        print(f"Partition ajoutée : {year} {season} ({len(edition)} lignes)")
+
+    # Mise à jour additive des tables dérivées
+    medals = data_store.get_medal_rows(new_rows)
+    _merge_aggregate("medal_cube", data_store.compute_medal_cube(new_rows), data_store.MEDAL_CUBE_KEYS)
+    _merge_aggregate(
+        "edition_summary",
+        data_store.compute_edition_summary(new_rows),
+        [key for key in data_store.MEDAL_CUBE_KEYS if key != "Sport"],
+    )
+    if not medals.empty:
+        _merge_breakdown(data_store.compute_medal_breakdown(medals))
+        _merge_athletes(compute_athletes(medals))
+        _merge_countries(medals)
+
+    # Les petites tables sont recalculées à partir des tables mises à jour
+    build_top_countries()
+    build_top_athletes()
+    build_disciplines()
+
+    # Le manifeste est mis à jour avec les nouvelles clés des étapes rafraîchies
+    file_hashes = _file_hashes()
+    keys = _step_keys(file_hashes)
+    refreshed = up_to_date - {"viz2_data"}
+    if "viz2_data" in keys:
+        build_viz2_data()
+        refreshed.add("viz2_data")
+    for name in refreshed:
+        manifest[name] = keys[name]
+    _save_manifest(manifest)
+    write_derived_manifest()
+    return editions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Construit les données dérivées de l'application.")
+    parser.add_argument("--force", action="store_true", help="reconstruit toutes les étapes")
+    parser.add_argument("--append", metavar="FICHIER", help="ajoute une nouvelle édition (CSV des participations)")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="[%(name)s] %(message)s")  # Affiche les chargements de project.data_store
+    if args.append:
+        append_edition(args.append)
+    else:
+        build_all(force=args.force)
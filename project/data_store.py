@@ -0,0 +1,435 @@
+"""
+Accès partagé aux données des visualisations.
+
+Les tables du dossier 'data' sont chargées une seule fois par processus, puis
+partagées entre toutes les visualisations sous forme de vues en lecture seule.
+Le mode copy-on-write de pandas est activé à l'import : une vue modifiée par un
+callback est copiée à ce moment-là, sans jamais altérer la table partagée. Les
+callbacks peuvent donc s'exécuter en parallèle dans plusieurs threads.
+Lorsqu'un artefact typé (Parquet) a été construit avec `python -m project.data_build`,
+il est utilisé à la place du CSV brut. Les tables dérivées produites par cette
+commande sont toutes rangées dans 'data/derived' (voir `load_derived`).
+"""
+
+# Importation des bibliothèques nécessaires
+import logging  # Pour journaliser les chargements sans écrire sur la sortie standard
+import os  # Pour manipuler les chemins de fichiers
+import threading  # Pour éviter un double chargement entre plusieurs threads
+import time  # Pour mesurer le temps de chargement
+from pathlib import Path
+
+import numpy as np  # Pour les recherches vectorisées d'identifiants
+import pandas as pd  # Pour manipuler les données sous forme de DataFrame
+
+# Les vues retournées partagent la mémoire des tables chargées : toute modification
+# (colonne ajoutée, `.loc[...] = ...`) doit produire une copie plutôt qu'écrire dans la table.
+pd.set_option("mode.copy_on_write", True)
+
+# Dossier 'data' à la racine du projet (indépendant du répertoire courant)
+DATA_FOLDER = Path(os.path.abspath(__file__)).parent.parent / "data"
+ARTIFACTS_FOLDER = DATA_FOLDER / "artifacts"  # Artefacts typés générés par project.data_build
+DERIVED_FOLDER = DATA_FOLDER / "derived"  # Tables dérivées (visualisation 4) générées par project.data_build
+ATHLETE_GAMES_FILE = "all_athlete_games.csv"  # Table principale des participations
+HOST_EDITIONS_FILE = "host_editions.csv"  # Ville et pays hôte (NOC en usage lors de l'édition) de chaque édition
+REGIONS_FILE = "all_regions.csv"  # Pays (Region) de chaque code NOC : noms canoniques des pays
+COUNTRY_ALIASES_FILE = "country_aliases.csv"  # Autres noms des pays dans les sources externes (Banque mondiale, FMI...)
+UNKNOWN_COUNTRY = 0  # Identifiant retourné pour un code ou un nom de pays non résolu
+MEDAL_CUBE_KEYS = ["NOC", "Team", "Year", "Season", "City", "Sport"]  # Dimensions du cube des médailles
+EDITION_KEYS = ["Year", "Season"]  # Colonnes identifiant une édition des Jeux
+PARTITIONED_TABLES = [ATHLETE_GAMES_FILE]  # Tables dont l'artefact est découpé en une partition par édition
+MIN_MEDAL_YEAR = 1992  # Première année prise en compte dans le détail des médailles (visualisation 4)
+MEDAL_TYPES = ["Gold", "Silver", "Bronze"]  # Types de médailles, dans l'ordre du détail des médailles
+
+
+def _parse_temperature(value):
+    """
+    Convertit une température du CSV en nombre. Le signe moins y est encodé
+    par un '_' (par exemple '_3.79' pour -3.79).
+    """
+    return float(value.replace("_", "-")) if value else float("nan")
+
+
+# Schéma de lecture de chaque table : types des colonnes et options de lecture du CSV
+TABLE_SCHEMAS = {
+    ATHLETE_GAMES_FILE: {
+        "dtype": {
+            "NOC": "category",
+            "Team": "category",
+            "Sport": "category",
+            "Event": "category",
+            "City": "category",
+            "Season": "category",
+            "Medal": "category",
+            "Year": "int16",
+        },
+    },
+    HOST_EDITIONS_FILE: {
+        "dtype": {"Year": "int16", "Season": "str", "City": "str", "NOC": "str"},
+    },
+    REGIONS_FILE: {
+        "dtype": {"NOC": "category", "Region": "category"},
+    },
+    COUNTRY_ALIASES_FILE: {
+        "dtype": {"Alias": "str", "Country": "str"},
+    },
+    "Countries_codes_names.csv": {
+        "sep": ";",
+        "encoding": "utf-8-sig",
+        "dtype": {"Code": "category", "Name": "category"},
+    },
+    "countries_per_continent.csv": {
+        "dtype": {"flagCode": "category", "country": "category", "continent": "category"},
+    },
+    "average_temperature_per_country.csv": {
+        "encoding": "mac_roman",
+        "dtype": {"Region": "category"},
+        "converters": {"Average Temperature": _parse_temperature},
+    },
+    "SP_POP_TOTL.csv": {
+        "encoding": "utf-8-sig",
+        "dtype": {"Country Name": "category", "Country Code": "category"},
+    },
+}
+
+_tables = {}  # Tables déjà chargées, indexées par nom de fichier
+_load_stats = {}  # Temps de chargement et mémoire occupée par table
+logger = logging.getLogger(__name__)  # Journal des chargements (voir aussi `get_load_stats`)
+_lock = threading.RLock()  # Verrou protégeant le premier chargement (réentrant pour les tables dérivées)
+
+
+def get_artifact_path(filename):
+    """
+    Retourne le chemin de l'artefact Parquet correspondant à un fichier CSV du dossier 'data'.
+    Pour une table partitionnée (voir PARTITIONED_TABLES), il s'agit d'un dossier
+    contenant un fichier Parquet par édition.
+    """
+    if filename in PARTITIONED_TABLES:
+        return ARTIFACTS_FOLDER / Path(filename).stem
+    return ARTIFACTS_FOLDER / (Path(filename).stem + ".parquet")
+
+
+def get_partition_path(filename, year, season):
+    """
+    Retourne le chemin de la partition d'une édition (année et saison) d'une table partitionnée.
+    """
+    return get_artifact_path(filename) / f"{year}_{season}.parquet"
+
+
+def _artifact_files(filename):
+    """
+    Retourne la liste des fichiers Parquet formant l'artefact d'une table (vide s'il n'existe pas).
+    """
+    artifact = get_artifact_path(filename)
+    if filename in PARTITIONED_TABLES:
+        return sorted(artifact.glob("*.parquet"))
+    return [artifact] if artifact.exists() else []
+
+
+def read_csv_typed(filename):
+    """
+    Lit un fichier CSV du dossier 'data' en appliquant son schéma (types et encodage).
+    """
+    return pd.read_csv(DATA_FOLDER / filename, **TABLE_SCHEMAS.get(filename, {}))
+
+
+def read_artifact(filename):
+    """
+    Lit l'artefact Parquet d'une table. Les partitions d'une table partitionnée sont
+    concaténées puis remises dans l'ordre des lignes du CSV (conservé dans leur index),
+    et les types du schéma sont réappliqués (les catégories diffèrent d'une partition à l'autre).
+    """
+    files = _artifact_files(filename)
+    if filename not in PARTITIONED_TABLES:
+        return pd.read_parquet(files[0])
+    df = pd.concat([pd.read_parquet(path) for path in files]).sort_index(kind="stable").reset_index(drop=True)
+    return df.astype(TABLE_SCHEMAS[filename]["dtype"])
+
+
+def _read_table(filename):
+    """
+    Lit une table depuis son artefact Parquet s'il est à jour, sinon depuis le CSV typé.
+    Retourne le DataFrame et le nom de la source utilisée.
+    """
+    source = DATA_FOLDER / filename
+    files = _artifact_files(filename)
+
+    # L'artefact n'est utilisé que s'il est plus récent que le CSV source
+    if files and (not source.exists() or max(path.stat().st_mtime for path in files) >= source.stat().st_mtime):
+        return read_artifact(filename), get_artifact_path(filename).name
+    return read_csv_typed(filename), source.name
+
+
+def _load_cached(name, reader):
+    """
+    Charge une table une seule fois par processus à l'aide de `reader`, qui
+    retourne le DataFrame et le nom de la source utilisée.
+
+    Les appels suivants retournent une vue (copie superficielle) de la même
+    table en mémoire. Grâce au mode copy-on-write, les modifications faites par
+    l'appelant sur cette vue ne sont jamais visibles des autres visualisations.
+    Le chargement est journalisé (niveau INFO) une fois le verrou libéré.
+    """
+    loaded = None  # Statistiques du chargement effectué par cet appel
+    with _lock:
+        if name not in _tables:
+            start = time.perf_counter()
+            df, source_name = reader()  # Lecture (ou calcul) unique de la table
+            elapsed = time.perf_counter() - start
+            memory_mb = float(df.memory_usage(deep=True).sum()) / 1e6  # Mémoire occupée en Mo
+
+            _tables[name] = df
+            _load_stats[name] = loaded = {
+                "source": source_name,
+                "rows": len(df),
+                "seconds": round(elapsed, 3),
+                "memory_mb": round(memory_mb, 1),
+            }
+
+    if loaded:
+        logger.info("%s : %d lignes chargées en %.2f s (%.1f Mo)",
+                    loaded["source"], loaded["rows"], loaded["seconds"], loaded["memory_mb"])
+
+    # Retourne une vue partageant la mémoire de la table chargée
+    return _tables[name].copy(deep=False)
+
+
+def load_table(filename):
+    """
+    Charge une table du dossier 'data' une seule fois par processus (voir `_load_cached`).
+    """
+    return _load_cached(filename, lambda: _read_table(filename))
+
+
+def load_derived(filename):
+    """
+    Charge une table dérivée du dossier 'data/derived' (par exemple top10_pays_summer.csv)
+    une seule fois par processus (voir `_load_cached`).
+    """
+    path = DERIVED_FOLDER / filename
+    return _load_cached(f"derived/{filename}", lambda: (pd.read_csv(path), f"derived/{filename}"))
+
+
+def get_athlete_games():
+    """
+    Retourne la table de toutes les participations aux Jeux (all_athlete_games.csv).
+    Les colonnes NOC, Team, Sport, Event, City, Season et Medal sont catégorielles
+    et Year est un entier sur 16 bits : les regroupements doivent utiliser `observed=True`.
+    """
+    return load_table(ATHLETE_GAMES_FILE)
+
+
+def get_host_editions():
+    """
+    Retourne la table des éditions hôtes (host_editions.csv), indexée par (Year, Season) :
+    une ligne par édition, avec la ville (City) et le code du pays hôte (NOC).
+    La table est indexée une seule fois par processus.
+    """
+    return _load_cached(
+        "host_editions",
+        lambda: (load_table(HOST_EDITIONS_FILE).set_index(EDITION_KEYS).sort_index(), "host_editions"),
+    )
+
+
+def get_host_nocs(df):
+    """
+    Retourne, pour chaque ligne de `df` (colonnes Year et Season), le code du pays hôte
+    de l'édition (tableau d'objets, NaN pour une édition absente de host_editions.csv).
+    La recherche est une jointure vectorisée sur l'index (Year, Season).
+    """
+    editions = pd.MultiIndex.from_arrays(
+        [df["Year"].to_numpy(dtype="int16"), df["Season"].to_numpy(dtype=object)], names=EDITION_KEYS
+    )
+    return get_host_editions()["NOC"].reindex(editions).to_numpy(dtype=object)
+
+
+def compute_country_keys(regions, aliases):
+    """
+    Construit la dimension des pays et résout tous les codes et noms qui les désignent.
+    Chaque pays (Region de all_regions.csv, nom canonique) reçoit un identifiant entier
+    CountryId à partir de 1, dans l'ordre alphabétique. Retourne une ligne par clé :
+      - Scheme : 'NOC' (code olympique) ou 'Name' (nom canonique ou alias de country_aliases.csv)
+      - Key : le code ou le nom
+      - CountryId, Country : identifiant et nom canonique du pays
+    Lève ValueError si un alias désigne un pays absent de all_regions.csv.
+    """
+    regions = regions.dropna(subset=["Region"])  # Codes sans pays (ROT, UNK) : non résolus
+    names = np.sort(regions["Region"].unique().to_numpy(dtype=object))
+    ids = pd.Series(np.arange(1, len(names) + 1, dtype="int16"), index=names)
+
+    unknown = sorted(set(aliases["Country"]) - set(names))
+    if unknown:
+        raise ValueError(f"{COUNTRY_ALIASES_FILE} : pays absents de {REGIONS_FILE} : {', '.join(unknown)}")
+
+    keys = pd.concat([
+        pd.DataFrame({"Scheme": "NOC", "Key": regions["NOC"].to_numpy(dtype=object), "Country": regions["Region"].to_numpy(dtype=object)}),
+        pd.DataFrame({"Scheme": "Name", "Key": names, "Country": names}),
+        pd.DataFrame({"Scheme": "Name", "Key": aliases["Alias"], "Country": aliases["Country"]}),
+    ], ignore_index=True).drop_duplicates(["Scheme", "Key"])
+    keys["CountryId"] = ids.reindex(keys["Country"]).to_numpy()
+    return keys[["Scheme", "Key", "CountryId", "Country"]].reset_index(drop=True)
+
+
+def _read_country_keys():
+    """
+    Lit la table des clés des pays depuis son artefact s'il est plus récent que ses
+    deux sources, sinon la calcule (voir `compute_country_keys`). La table est indexée par (Scheme, Key).
+    """
+    artifact = ARTIFACTS_FOLDER / "country_keys.parquet"
+    sources = [DATA_FOLDER / REGIONS_FILE, DATA_FOLDER / COUNTRY_ALIASES_FILE]
+    latest_source = max((path.stat().st_mtime for path in sources if path.exists()), default=0)
+
+    if artifact.exists() and artifact.stat().st_mtime >= latest_source:
+        keys, source_name = pd.read_parquet(artifact), artifact.name
+    else:
+        keys, source_name = compute_country_keys(load_table(REGIONS_FILE), load_table(COUNTRY_ALIASES_FILE)), "country_keys (calculé)"
+    return keys.set_index(["Scheme", "Key"]).sort_index(), source_name
+
+
+def get_country_keys():
+    """
+    Retourne la table des clés des pays indexée par (Scheme, Key), chargée une seule fois par processus.
+    """
+    return _load_cached("country_keys", _read_country_keys)
+
+
+def get_country_ids(values, scheme="Name"):
+    """
+    Retourne l'identifiant (CountryId, entier sur 16 bits) de chaque code NOC (`scheme='NOC'`)
+    ou nom de pays (`scheme='Name'`) de `values`, par une jointure vectorisée.
+    Les clés non résolues reçoivent UNKNOWN_COUNTRY.
+    """
+    ids = get_country_keys().loc[scheme, "CountryId"]
+    return ids.reindex(np.asarray(values, dtype=object)).fillna(UNKNOWN_COUNTRY).to_numpy(dtype="int16")
+
+
+def get_countries():
+    """
+    Retourne la dimension des pays : nom canonique (Country) indexé par CountryId.
+    """
+    keys = get_country_keys()
+    return keys.drop_duplicates("CountryId").set_index("CountryId")["Country"].sort_index()
+
+
+def get_load_stats():
+    """
+    Retourne, pour chaque table chargée, la source lue, le nombre de lignes,
+    le temps de chargement (en secondes) et la mémoire occupée (en Mo).
+    """
+    with _lock:
+        return {filename: dict(stats) for filename, stats in _load_stats.items()}
+
+
+def compute_medal_cube(athletes):
+    """
+    Agrège les participations en un cube compact NOC x Team x Year x Season x City x Sport.
+
+    Colonnes calculées :
+      - Gold, Silver, Bronze : nombre de médailles de chaque type (une par athlète médaillé)
+      - Medals : total des médailles
+      - Participants : nombre de participations (lignes de la table source)
+      - Athletes : nombre d'athlètes distincts
+    """
+    medal = athletes["Medal"]
+    cube = (
+        athletes.assign(Gold=medal == "Gold", Silver=medal == "Silver", Bronze=medal == "Bronze")
+        .groupby(MEDAL_CUBE_KEYS, observed=True, dropna=False)
+        .agg(
+            Gold=("Gold", "sum"),
+            Silver=("Silver", "sum"),
+            Bronze=("Bronze", "sum"),
+            Participants=("Name", "size"),
+            Athletes=("Name", "nunique"),
+        )
+        .astype("int32")
+        .reset_index()
+    )
+    cube.insert(cube.columns.get_loc("Participants"), "Medals", cube["Gold"] + cube["Silver"] + cube["Bronze"])
+    return cube
+
+
+def compute_edition_summary(athletes):
+    """
+    Agrège les participations par pays et par édition (NOC x Team x Year x Season x City),
+    toutes disciplines confondues. Le nombre d'athlètes distincts n'étant pas additif
+    entre les sports, il est recalculé à ce niveau plutôt que sommé depuis le cube.
+    """
+    keys = [key for key in MEDAL_CUBE_KEYS if key != "Sport"]
+    summary = (
+        athletes.assign(HasMedal=athletes["Medal"].notna())
+        .groupby(keys, observed=True, dropna=False)
+        .agg(
+            Medals=("HasMedal", "sum"),
+            Participants=("Name", "size"),
+            Athletes=("Name", "nunique"),
+        )
+        .astype("int32")
+        .reset_index()
+    )
+    return summary
+
+
+def get_medal_rows(athletes):
+    """
+    Retourne les participations ayant rapporté une médaille, à partir de MIN_MEDAL_YEAR.
+    """
+    return athletes[athletes["Medal"].notna() & (athletes["Year"] >= MIN_MEDAL_YEAR)]
+
+
+def compute_medal_breakdown(medals):
+    """
+    Compte les médailles d'or, d'argent et de bronze par athlète, saison et discipline.
+    Retourne un DataFrame avec les colonnes nom, saison, discipline, gold, silver et bronze.
+    """
+    breakdown = (
+        medals.groupby(["Name", "Season", "Sport", "Medal"], observed=True)
+        .size()
+        .unstack(fill_value=0)
+        .reindex(columns=MEDAL_TYPES, fill_value=0)
+        .rename(columns={"Gold": "gold", "Silver": "silver", "Bronze": "bronze"})
+        .reset_index()
+        .rename(columns={"Name": "nom", "Season": "saison", "Sport": "discipline"})
+    )
+    breakdown["saison"] = breakdown["saison"].astype(str)
+    breakdown["discipline"] = breakdown["discipline"].astype(str)
+    return breakdown
+
+
+def _read_derived(name, compute):
+    """
+    Lit une table dérivée de all_athlete_games depuis son artefact s'il est à jour,
+    sinon la calcule à partir de la table partagée des participations.
+    """
+    artifact = ARTIFACTS_FOLDER / f"{name}.parquet"
+    sources = [DATA_FOLDER / ATHLETE_GAMES_FILE, *_artifact_files(ATHLETE_GAMES_FILE)]
+    latest_source = max((path.stat().st_mtime for path in sources if path.exists()), default=0)
+
+    if artifact.exists() and artifact.stat().st_mtime >= latest_source:
+        return pd.read_parquet(artifact), artifact.name
+    return compute(get_athlete_games()), f"{name} (calculé)"
+
+
+def get_medal_cube():
+    """
+    Retourne le cube des médailles (voir `compute_medal_cube`), construit une seule fois
+    par processus et partagé par toutes les visualisations.
+    """
+    return _load_cached("medal_cube", lambda: _read_derived("medal_cube", compute_medal_cube))
+
+
+def get_edition_summary():
+    """
+    Retourne le résumé par pays et par édition (voir `compute_edition_summary`),
+    construit une seule fois par processus.
+    """
+    return _load_cached("edition_summary", lambda: _read_derived("edition_summary", compute_edition_summary))
+
+
+def get_medal_breakdown():
+    """
+    Retourne le détail des médailles par athlète, saison et discipline (voir
+    `compute_medal_breakdown`), lu depuis l'artefact construit par project.data_build.
+    """
+    return _load_cached(
+        "medal_breakdown",
+        lambda: _read_derived("medal_breakdown", lambda athletes: compute_medal_breakdown(get_medal_rows(athletes))),
+    )
@@ -0,0 +1,157 @@
+"""
+Variantes de figures servies sous forme de JSON statique.
+
+Les visualisations enregistrent ici chacune de leurs variantes (par exemple une
+figure par saison). Chaque variante est construite une seule fois par processus,
+puis servie telle quelle par la route `/figures/<nom>.json` avec des en-têtes de
+cache HTTP : le navigateur la garde en mémoire et les callbacks clientside
+(voir assets/figures.js) passent d'une variante à l'autre sans solliciter le serveur.
+
+Les variantes peuvent aussi être sérialisées au moment du build :
+    python -m project.figure_assets
+écrit un instantané de chacune dans 'data/artifacts/figures'. Le nom de l'instantané
+contient l'empreinte du code qui construit la variante (voir `get_code_fingerprint`) :
+un instantané écrit par une autre version du code n'est jamais servi. Un instantané
+à jour est servi tel quel, sans construire la figure, tant qu'il est aussi plus récent
+que la dernière construction des données.
+"""
+
+# Importation des bibliothèques nécessaires
+import hashlib  # Pour calculer l'ETag des figures et l'empreinte du code
+import sys  # Pour retrouver le module qui a enregistré une variante
+import threading  # Pour éviter de construire deux fois la même figure
+import time  # Pour mesurer la durée de construction des instantanés
+from pathlib import Path  # Pour parcourir les sources des visualisations
+
+import plotly.io as pio  # Pour sérialiser les figures en JSON
+from flask import Response, abort, request  # Pour servir les figures
+
+from project import data_store  # Emplacement des artefacts de données
+from project import metrics  # Succès et échecs du cache des figures
+
+FIGURE_ROUTE = "/figures/<name>.json"  # Route servant les variantes de figures
+MAX_AGE = 3600  # Durée de cache côté navigateur (en secondes)
+SNAPSHOT_FOLDER = data_store.ARTIFACTS_FOLDER / "figures"  # Instantanés des variantes écrits au moment du build
+# Manifestes réécrits à chaque construction des données : un instantané plus ancien est périmé
+DATA_MANIFESTS = [data_store.ARTIFACTS_FOLDER / "build_manifest.json", data_store.DERIVED_FOLDER / "manifest.json"]
+PROJECT_FOLDER = Path(__file__).resolve().parent  # Modules partagés (data_store, figure_spec...) inclus dans l'empreinte
+
+_builders = {}  # Fonctions de construction des figures, indexées par nom de variante
+_payloads = {}  # Figures déjà sérialisées : nom -> (JSON, ETag)
+_fingerprints = {}  # Empreintes du code déjà calculées, indexées par dossier de visualisation
+_locks = {}  # Verrou de chaque variante : la construction d'une figure ne bloque pas les autres
+_locks_guard = threading.Lock()  # Verrou protégeant la création des verrous des variantes
+
+
+def register_figure(name, builder):
+    """
+    Enregistre une variante de figure. `builder` est une fonction sans argument
+    qui retourne la figure (objet Plotly ou dictionnaire).
+    """
+    _builders[name] = builder
+
+
+def is_registered(name):
+    """
+    Indique si une variante de figure porte ce nom.
+    """
+    return name in _builders
+
+
+def get_code_fingerprint(name):
+    """
+    Retourne l'empreinte (12 caractères) du code qui construit une variante : les sources
+    Python du dossier du module qui l'a enregistrée (par exemple project/visualisation_1)
+    et les modules partagés du dossier project.
+    """
+    folder = Path(sys.modules[_builders[name].__module__].__file__).resolve().parent
+    if folder not in _fingerprints:
+        digest = hashlib.sha256()
+        for path in sorted(folder.rglob("*.py")) + sorted(PROJECT_FOLDER.glob("*.py")):
+            digest.update(str(path.relative_to(PROJECT_FOLDER.parent)).encode("utf-8"))
+            digest.update(path.read_bytes())
+        _fingerprints[folder] = digest.hexdigest()[:12]
+    return _fingerprints[folder]
+
+
+def get_snapshot_path(name):
+    """
+    Retourne le chemin de l'instantané d'une variante pour la version actuelle du code.
+    """
+    return SNAPSHOT_FOLDER / f"{name}.{get_code_fingerprint(name)}.json"
+
+
+def _read_snapshot(name):
+    """
+    Retourne le JSON de l'instantané d'une variante, ou None s'il est absent ou périmé
+    (écrit par une autre version du code, ou avant la dernière construction des données).
+    """
+    path = get_snapshot_path(name)
+    if not path.exists():
+        return None
+    latest_build = max((manifest.stat().st_mtime for manifest in DATA_MANIFESTS if manifest.exists()), default=0)
+    if path.stat().st_mtime < latest_build:
+        return None
+    return path.read_text(encoding="utf-8")
+
+
+def get_figure_json(name):
+    """
+    Retourne le JSON et l'ETag d'une variante enregistrée. Au premier appel, le JSON
+    est lu depuis son instantané s'il est à jour, sinon la figure est construite.
+    Lève KeyError si la variante n'est pas enregistrée.
+    """
+    metrics.record_cache("figure_assets", name in _payloads)
+    if name not in _payloads:
+        builder = _builders[name]
+        with _locks_guard:
+            lock = _locks.setdefault(name, threading.Lock())
+        with lock:
+            if name not in _payloads:
+                payload = _read_snapshot(name) or pio.to_json(builder(), validate=False)
+                _payloads[name] = (payload, hashlib.md5(payload.encode("utf-8")).hexdigest())
+    return _payloads[name]
+
+
+def write_snapshots():
+    """
+    Construit chaque variante enregistrée et écrit son instantané JSON dans SNAPSHOT_FOLDER,
+    en supprimant les instantanés écrits par les versions précédentes du code.
+    """
+    SNAPSHOT_FOLDER.mkdir(parents=True, exist_ok=True)
+    start = time.perf_counter()
+    for name, builder in sorted(_builders.items()):
+        for stale in SNAPSHOT_FOLDER.glob(f"{name}.*json"):  # Anciennes empreintes (et anciens noms sans empreinte)
+            stale.unlink()
+        get_snapshot_path(name).write_text(pio.to_json(builder(), validate=False), encoding="utf-8")
+    print(f"{len(_builders)} instantanés écrits dans {SNAPSHOT_FOLDER} ({time.perf_counter() - start:.2f} s)")
+
+
+def serve_figure(name):
+    """
+    Vue Flask retournant une variante de figure en JSON, avec des en-têtes de cache.
+    """
+    if not is_registered(name):
+        abort(404)
+
+    payload, etag = get_figure_json(name)
+    response = Response(payload, mimetype="application/json")
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = MAX_AGE
+    return response.make_conditional(request)  # Répond 304 si le navigateur a déjà cette version
+
+
+def init_app(server):
+    """
+    Ajoute la route des variantes de figures au serveur Flask de l'application Dash.
+    """
+    server.add_url_rule(FIGURE_ROUTE, "figure_assets", serve_figure)
+
+
+if __name__ == "__main__":
+    # Les visualisations enregistrent leurs variantes dans le module importé, pas dans __main__
+    from project import figure_assets
+    import app  # L'import de l'application enregistre toutes les variantes
+
+    figure_assets.write_snapshots()
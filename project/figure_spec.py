@@ -0,0 +1,123 @@
+"""
+Construction légère des figures Plotly sous forme de dictionnaires.
+
+Les figures les plus lourdes (heatmaps de la visualisation 1, graphiques lollipop
+de la visualisation 3, cercles des athlètes de la visualisation 4, reconstruits à
+chaque changement de discipline) décrivent directement le dictionnaire final de la figure :
+traces et mise en page, avec des tableaux numpy. Contrairement à
+plotly.graph_objects, aucune propriété n'est validée au moment de l'affectation,
+ce qui supprime l'essentiel du temps de construction côté serveur.
+
+`subplot_grid` reproduit la grille de `plotly.subplots.make_subplots` (domaines des
+axes et titres des sous-graphiques) et `make_figure` ajoute le thème par défaut,
+comme le ferait `go.Figure`. Pendant le développement, la variable d'environnement
+FIGURE_SPEC_VALIDATE=1 fait valider chaque figure par plotly.graph_objects :
+une propriété invalide lève alors ValueError.
+"""
+
+# Importation des bibliothèques nécessaires
+import os  # Pour lire la variable d'environnement de validation
+
+import plotly.colors as pc  # Pour développer les échelles de couleurs nommées
+import plotly.graph_objects as go  # Uniquement pour le thème par défaut et la validation
+
+VALIDATE = os.environ.get("FIGURE_SPEC_VALIDATE", "") not in ("", "0")  # Validation des figures (développement)
+
+_template = None  # Thème Plotly par défaut, calculé une seule fois
+_colorscales = {}  # Échelles de couleurs nommées déjà développées
+
+
+def get_template():
+    """
+    Retourne le thème Plotly par défaut, tel que l'applique go.Figure.
+    """
+    global _template
+    if _template is None:
+        _template = go.Figure().to_plotly_json()["layout"].get("template", {})
+    return _template
+
+
+def get_colorscale(name):
+    """
+    Retourne l'échelle de couleurs nommée de Plotly (par exemple 'Blues') sous forme
+    de liste [position, couleur]. Plotly.js a ses propres échelles nommées, différentes
+    de celles de plotly.graph_objects : l'échelle doit donc être développée.
+    L'échelle est développée une seule fois par nom et ne doit pas être modifiée.
+    """
+    if name not in _colorscales:
+        _colorscales[name] = pc.get_colorscale(name)
+    return _colorscales[name]
+
+
+def get_axis_ids(row, col, cols):
+    """
+    Retourne les identifiants des axes ('x', 'y'), ('x2', 'y2')... du sous-graphique
+    (row, col) d'une grille de `cols` colonnes, numérotés ligne par ligne depuis 1.
+    """
+    index = (row - 1) * cols + col
+    suffix = str(index) if index > 1 else ""
+    return f"x{suffix}", f"y{suffix}"
+
+
+def get_axis_key(axis_id):
+    """
+    Retourne la clé de la mise en page d'un axe à partir de son identifiant ('y3' -> 'yaxis3').
+    """
+    return f"{axis_id[0]}axis{axis_id[1:]}"
+
+
+def subplot_grid(rows, cols, horizontal_spacing, vertical_spacing, titles=None):
+    """
+    Retourne la mise en page d'une grille de sous-graphiques, comme make_subplots
+    (cellule (1, 1) en haut à gauche) : axes x et y ancrés deux à deux, et annotations
+    des titres `titles` (un par sous-graphique, ligne par ligne ; les titres vides
+    ou en trop sont ignorés).
+    """
+    width = (1.0 - horizontal_spacing * (cols - 1)) / cols
+    height = (1.0 - vertical_spacing * (rows - 1)) / rows
+
+    layout = {}
+    annotations = []
+    for row in range(1, rows + 1):
+        for col in range(1, cols + 1):
+            # Mêmes calculs que make_subplots, pour obtenir exactement les mêmes domaines
+            x_start = sum([width] * (col - 1)) + (col - 1) * horizontal_spacing
+            from_bottom = rows - row  # Les lignes sont numérotées depuis le haut
+            y_start = max(sum([height] * from_bottom) + from_bottom * vertical_spacing, 0.0)
+            x_domain = [x_start, x_start + width]
+            y_domain = [y_start, min(y_start + height, 1.0)]
+
+            x_id, y_id = get_axis_ids(row, col, cols)
+            layout[get_axis_key(x_id)] = {"domain": x_domain, "anchor": y_id}
+            layout[get_axis_key(y_id)] = {"domain": y_domain, "anchor": x_id}
+
+            # Titre centré au-dessus du sous-graphique
+            index = (row - 1) * cols + col - 1
+            if titles and index < len(titles) and titles[index]:
+                annotations.append({
+                    "text": titles[index],
+                    "x": sum(x_domain) / 2.0,
+                    "y": y_domain[1],
+                    "xref": "paper",
+                    "yref": "paper",
+                    "xanchor": "center",
+                    "yanchor": "bottom",
+                    "showarrow": False,
+                    "font": {"size": 16},
+                })
+
+    if annotations:
+        layout["annotations"] = annotations
+    return layout
+
+
+def make_figure(data, layout):
+    """
+    Retourne le dictionnaire d'une figure (traces `data` et mise en page `layout`),
+    avec le thème par défaut. Avec FIGURE_SPEC_VALIDATE=1, la figure est d'abord
+    validée par plotly.graph_objects.
+    """
+    figure = {"data": data, "layout": {"template": get_template(), **layout}}
+    if VALIDATE:
+        go.Figure(figure)  # Lève ValueError si une propriété est invalide
+    return figure
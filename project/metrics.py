@@ -0,0 +1,219 @@
+"""
+Mesures de performance des callbacks Dash et des variantes de figures.
+
+Des hooks Flask mesurent chaque requête `/_dash-update-component` (un appel de
+callback, identifié par ses sorties) et chaque requête `/figures/<nom>.json` :
+  - temps écoulé et temps CPU du thread qui traite la requête ;
+  - taille de la réponse (le JSON des figures renvoyées) ;
+  - succès ou échec des caches consultés pendant la requête (voir `record_cache`).
+
+Les mesures sont exposées au format texte de Prometheus par la route `/metrics`
+(histogrammes de latence par callback), et chaque réponse mesurée reçoit un
+en-tête `Server-Timing` lisible dans l'onglet réseau du navigateur.
+Les mesures sont propres à chaque processus (un par worker gunicorn).
+"""
+
+# Importation des bibliothèques nécessaires
+import threading  # Pour protéger les compteurs partagés entre les threads
+import time  # Pour mesurer le temps écoulé et le temps CPU
+
+from flask import Response, g, has_request_context, request  # Pour les hooks et la route des mesures
+
+METRICS_ROUTE = "/metrics"  # Route exposant les mesures
+CALLBACK_ROUTE = "/_dash-update-component"  # Route des appels de callbacks Dash
+FIGURE_ROUTE_PREFIX = "/figures/"  # Préfixe de la route des variantes de figures (voir project.figure_assets)
+LATENCY_BUCKETS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0]  # Bornes des histogrammes (en secondes)
+SIZE_BUCKETS = [1_000, 10_000, 50_000, 100_000, 500_000, 1_000_000, 5_000_000]  # Bornes des tailles de réponse (en octets)
+UNKNOWN_CALLBACK = "callback:unknown"  # Cible des appels de callbacks en échec ou sans sorties valides
+UNKNOWN_FIGURE = "figure:unknown"  # Cible des figures non enregistrées ou en échec
+
+_stats = {}  # Mesures par cible (callback ou figure) : voir `_new_stats`
+_lock = threading.Lock()  # Verrou protégeant `_stats`
+
+
+def _new_stats():
+    """
+    Retourne les compteurs vides d'une cible.
+    """
+    return {
+        "latency": [0] * (len(LATENCY_BUCKETS) + 1),  # Histogramme du temps écoulé (dernier : +Inf)
+        "size": [0] * (len(SIZE_BUCKETS) + 1),  # Histogramme de la taille des réponses
+        "count": 0,
+        "wall_seconds": 0.0,
+        "cpu_seconds": 0.0,
+        "bytes": 0,
+        "cache": {"hit": 0, "miss": 0, "none": 0},  # Requêtes servies depuis un cache, ou non
+    }
+
+
+def _bucket(value, bounds):
+    """
+    Retourne l'indice du premier intervalle de l'histogramme contenant `value`.
+    """
+    for index, bound in enumerate(bounds):
+        if value <= bound:
+            return index
+    return len(bounds)
+
+
+def record_cache(name, hit):
+    """
+    Signale la consultation d'un cache (`hit` : la valeur était déjà calculée) pendant
+    la requête en cours. Sans requête en cours (construction hors ligne), ne fait rien.
+    """
+    if has_request_context() and "metrics_start" in g:
+        g.metrics_cache.append((name, hit))
+
+
+def record(target, wall_seconds, cpu_seconds, size, cache_status):
+    """
+    Ajoute une mesure aux compteurs d'une cible.
+    """
+    with _lock:
+        stats = _stats.setdefault(target, _new_stats())
+        stats["latency"][_bucket(wall_seconds, LATENCY_BUCKETS)] += 1
+        stats["size"][_bucket(size, SIZE_BUCKETS)] += 1
+        stats["count"] += 1
+        stats["wall_seconds"] += wall_seconds
+        stats["cpu_seconds"] += cpu_seconds
+        stats["bytes"] += size
+        stats["cache"][cache_status] += 1
+
+
+def _get_target(response):
+    """
+    Retourne le nom de la cible de la requête en cours, ou None si elle n'est pas mesurée.
+    Pour un callback, il s'agit de ses sorties (par exemple 'slopechart.figure').
+    Les requêtes en échec et les figures non enregistrées sont regroupées sous une cible
+    fixe ('callback:unknown', 'figure:unknown') : une URL inventée ne crée pas de cible.
+    """
+    if request.path == CALLBACK_ROUTE:
+        payload = request.get_json(silent=True)
+        output = payload.get("output") if isinstance(payload, dict) else None
+        if not isinstance(output, str) or not output or response.status_code >= 400:
+            return UNKNOWN_CALLBACK
+        return f"callback:{output}"
+    if request.path.startswith(FIGURE_ROUTE_PREFIX):
+        # Importation locale : project.figure_assets importe ce module
+        from project import figure_assets
+
+        name = request.path[len(FIGURE_ROUTE_PREFIX):].removesuffix(".json")
+        if not figure_assets.is_registered(name) or response.status_code >= 400:
+            return UNKNOWN_FIGURE
+        return f"figure:{name}"
+    return None
+
+
+def _before_request():
+    """
+    Démarre la mesure d'une requête de callback ou de figure.
+    """
+    if request.path == CALLBACK_ROUTE or request.path.startswith(FIGURE_ROUTE_PREFIX):
+        g.metrics_start = (time.perf_counter(), time.thread_time())
+        g.metrics_cache = []  # Caches consultés pendant la requête (voir `record_cache`)
+
+
+def _after_request(response):
+    """
+    Termine la mesure d'une requête, l'enregistre et ajoute l'en-tête Server-Timing.
+    """
+    if "metrics_start" not in g:
+        return response
+
+    start_wall, start_cpu = g.metrics_start
+    wall_seconds = time.perf_counter() - start_wall
+    cpu_seconds = time.thread_time() - start_cpu
+    size = response.calculate_content_length() or 0
+
+    # La requête est un succès de cache si tous les caches consultés avaient déjà la valeur
+    hits = [hit for _, hit in g.metrics_cache]
+    cache_status = "none" if not hits else ("hit" if all(hits) else "miss")
+
+    target = _get_target(response)
+    record(target, wall_seconds, cpu_seconds, size, cache_status)
+
+    # Durées en millisecondes, affichées par l'onglet réseau du navigateur
+    description = target.replace('"', "'")
+    response.headers.add(
+        "Server-Timing",
+        f'app;dur={wall_seconds * 1000:.1f};desc="{description}", '
+        f'cpu;dur={cpu_seconds * 1000:.1f}, cache;desc={cache_status}',
+    )
+    return response
+
+
+def _format_labels(labels):
+    """
+    Formate des étiquettes Prometheus : {cle="valeur",...}.
+    """
+    escaped = {key: str(value).replace("\\", "\\\\").replace('"', '\\"') for key, value in labels.items()}
+    return "{" + ",".join(f'{key}="{value}"' for key, value in escaped.items()) + "}"
+
+
+def _format_histogram(lines, name, labels, counts, bounds, total):
+    """
+    Ajoute les lignes d'un histogramme Prometheus (intervalles cumulés, somme et nombre).
+    """
+    cumulative = 0
+    for bound, count in zip([*bounds, "+Inf"], counts):
+        cumulative += count
+        lines.append(f"{name}_bucket{_format_labels({**labels, 'le': bound})} {cumulative}")
+    lines.append(f"{name}_sum{_format_labels(labels)} {total}")
+    lines.append(f"{name}_count{_format_labels(labels)} {cumulative}")
+
+
+def render_metrics():
+    """
+    Retourne toutes les mesures au format texte de Prometheus.
+    """
+    with _lock:
+        snapshot = {target: {**stats, "cache": dict(stats["cache"])} for target, stats in sorted(_stats.items())}
+
+    lines = [
+        "# HELP dash_request_duration_seconds Temps écoulé par callback ou figure.",
+        "# TYPE dash_request_duration_seconds histogram",
+    ]
+    for target, stats in snapshot.items():
+        _format_histogram(lines, "dash_request_duration_seconds", {"target": target},
+                          stats["latency"], LATENCY_BUCKETS, round(stats["wall_seconds"], 6))
+
+    lines += [
+        "# HELP dash_request_cpu_seconds_total Temps CPU consommé par callback ou figure.",
+        "# TYPE dash_request_cpu_seconds_total counter",
+    ]
+    for target, stats in snapshot.items():
+        lines.append(f"dash_request_cpu_seconds_total{_format_labels({'target': target})} {round(stats['cpu_seconds'], 6)}")
+
+    lines += [
+        "# HELP dash_response_size_bytes Taille des réponses (JSON des figures) par callback ou figure.",
+        "# TYPE dash_response_size_bytes histogram",
+    ]
+    for target, stats in snapshot.items():
+        _format_histogram(lines, "dash_response_size_bytes", {"target": target},
+                          stats["size"], SIZE_BUCKETS, stats["bytes"])
+
+    lines += [
+        "# HELP dash_cache_requests_total Requêtes servies depuis un cache (hit), calculées (miss) ou sans cache (none).",
+        "# TYPE dash_cache_requests_total counter",
+    ]
+    for target, stats in snapshot.items():
+        for status, count in stats["cache"].items():
+            lines.append(f"dash_cache_requests_total{_format_labels({'target': target, 'status': status})} {count}")
+
+    return "\n".join(lines) + "\n"
+
+
+def serve_metrics():
+    """
+    Vue Flask retournant les mesures au format texte.
+    """
+    return Response(render_metrics(), mimetype="text/plain; version=0.0.4")
+
+
+def init_app(server):
+    """
+    Installe les hooks de mesure et la route des mesures sur le serveur Flask de l'application Dash.
+    """
+    server.before_request(_before_request)
+    server.after_request(_after_request)
+    server.add_url_rule(METRICS_ROUTE, "metrics", serve_metrics)
@@ -1,23 +1,21 @@
 # Importation des bibliothèques nécessaires pour créer une application Dash
 import dash
-from dash import html, dcc, callback  # Importation des composants HTML et des callbacks
+from dash import html, dcc, clientside_callback  # Importation des composants HTML et des callbacks
 import plotly.graph_objects as go  # Importation pour créer des graphiques avec Plotly
 from dash.dependencies import Input, Output  # Importation pour gérer les interactions utilisateur
 
 # Importation des fonctions et modules spécifiques à la visualisation 1
-from project.visualisation_1.init import get_figure as viz1_get_figure  # Fonction pour obtenir une figure vide
 import project.visualisation_1.preprocess as preprocess  # Module pour le prétraitement des données
 import project.visualisation_1.heatmap as heatmap  # Module pour créer des heatmaps
+from project import figure_assets  # Variantes de figures servies en JSON statique
 
-# Prétraitement des données pour la saison "Summer" (par défaut)
-data = preprocess.convert_data('Summer')
-
-# Création d'une figure vide pour la visualisation 1
-empty_fig = viz1_get_figure()
+SEASONS = ['Summer', 'Winter']  # Saisons proposées par le bouton radio
 
 # Définition de la mise en page de l'application
 def get_viz_1_html():
     return html.Div([  # Conteneur principal de la page
+        # Indique si la section est visible (mis à jour par assets/lazy_sections.js)
+        dcc.Store(id='viz1-visible', data=False),
         # En-tête de l'application
         html.Div([
             html.H2(  # Titre principal de la page
@@ -72,8 +70,7 @@ def get_viz_1_html():
             ),
             # Graphique pour afficher les visualisations
             dcc.Graph(
-                id='viz1-graph',  # Identifiant pour le graphique
-                figure=heatmap.create_multiple_heatmaps(data),  # Génération initiale du graphique avec les données prétraitées
+                id='viz1-graph',  # Identifiant pour le graphique (rempli par le callback quand la section est visible)
                 config=dict(
                     scrollZoom=False,  # Désactiver le zoom avec la molette
                     showTips=False,  # Désactiver les infobulles
@@ -107,13 +104,25 @@ def get_viz_1_html():
         )
     ])
 
-# Définition du callback pour mettre à jour le graphique en fonction de la saison sélectionnée
-@callback(
-    Output('viz1-graph', 'figure'),  # Mise à jour de la figure du graphique
-    [Input('season-toggle', 'value')]  # Entrée : valeur sélectionnée dans le bouton radio
-)
-def update_figure(selected_season):
+# Fonction pour construire la figure d'une saison
+def get_season_figure(selected_season):
     # Prétraitement des données pour la saison sélectionnée (Summer ou Winter)
     data = preprocess.convert_data(selected_season)
-    # Génération du graphique mis à jour avec les nouvelles données
-    return heatmap.create_multiple_heatmaps(data)
\ No newline at end of file
+    # Génération du graphique avec les données de la saison
+    return heatmap.create_multiple_heatmaps(data)
+
+# Une variante de figure par saison, construite une seule fois et mise en cache par le navigateur
+for season in SEASONS:
+    figure_assets.register_figure(f'viz1-{season}', lambda season=season: get_season_figure(season))
+
+# Callback clientside : le changement de saison charge la variante correspondante (voir assets/figures.js)
+clientside_callback(
+    """
+    function(selected_season, visible) {
+        return window.dash_clientside.figures.load(visible, 'viz1-' + selected_season);
+    }
+    """,
+    Output('viz1-graph', 'figure'),  # Mise à jour de la figure du graphique
+    [Input('season-toggle', 'value'),  # Entrée : valeur sélectionnée dans le bouton radio
+     Input('viz1-visible', 'data')]  # Entrée : visibilité de la section
+)
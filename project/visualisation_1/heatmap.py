@@ -1,40 +1,57 @@
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+import numpy as np
 import pandas as pd
 import project.visualisation_1.hover_template as hover
-import os
-
-# Charger le fichier CSV contenant les codes et noms des pays
-path = os.path.join("data", 'Countries_codes_names.csv')  # Chemin vers le fichier CSV
-country_codes = pd.read_csv(path, sep=';')  # Lecture du fichier CSV avec les codes et noms des pays
+from project import data_store
+from project import figure_spec  # Construction des figures sous forme de dictionnaires
+
+# Charger la table contenant les codes et noms des pays
+country_codes = data_store.load_table('Countries_codes_names.csv')  # Table des codes et noms des pays
+country_mapping = dict(zip(country_codes['Code'], country_codes['Name']))  # Dictionnaire code -> nom, construit une seule fois
+
+# Demi-largeur (en années) et demi-hauteur (en lignes) des rectangles des pays hôtes
+HOST_HALF_WIDTH = 1.8
+HOST_HALF_HEIGHT = 0.5
+
+# Fonction pour construire les contours de plusieurs rectangles dans une seule trace
+def get_rectangles(x_centers, y_centers, half_width, half_height):
+    """
+    Retourne les listes x et y décrivant le contour d'un rectangle centré sur chaque
+    point (x, y), les rectangles étant séparés par des valeurs None.
+    """
+    x_lines, y_lines = [], []
+    for x, y in zip(x_centers, y_centers):
+        x0, x1, y0, y1 = x - half_width, x + half_width, y - half_height, y + half_height
+        x_lines += [x0, x1, x1, x0, x0, None]
+        y_lines += [y0, y0, y1, y1, y0, None]
+    return x_lines, y_lines
 
 def create_multiple_heatmaps(data):
-    # Obtenir la liste des sports à partir des clés du dictionnaire `data`
-    sports = list(data.keys())
+    # Obtenir la liste des sports à partir des clés du dictionnaire `data` (sans la clé "Host_Countries")
+    sports = [key for key in data.keys() if key != "Host_Countries"]
+    host_countries = data["Host_Countries"]  # Pays organisateur de chaque année
 
     # Définir le nombre de colonnes et de lignes pour les sous-graphiques
     cols = 4  # Nombre de colonnes (modifiable)
     rows = 4  # Nombre de lignes (modifiable)
 
-    # Créer une figure avec des sous-graphiques
-    fig = make_subplots(
-        rows=rows,
-        cols=cols,
-        subplot_titles=[f"<b>{sport}</b>" for sport in sports],  # Ajouter les titres des sous-graphiques en gras
+    # Créer la grille des sous-graphiques (axes et titres)
+    layout = figure_spec.subplot_grid(
+        rows,
+        cols,
+        titles=[f"<b>{sport}</b>" for sport in sports],  # Ajouter les titres des sous-graphiques en gras
         horizontal_spacing=0.15,  # Espacement horizontal entre les sous-graphiques
         vertical_spacing=0.10,  # Espacement vertical entre les sous-graphiques
     )
+    traces = []  # Traces de la figure
 
     # Parcourir chaque sport pour créer les heatmaps
     for i, sport in enumerate(sports):
-        if sport == "Host_Countries":  # Ignorer la clé "Host_Countries"
-            continue
         df = pd.DataFrame(data[sport])  # Convertir les données du sport en DataFrame
 
         # Calculer la position du subplot (ligne et colonne)
         row = (i // cols) + 1  # Ligne du subplot
         col = (i % cols) + 1  # Colonne du subplot
+        x_id, y_id = figure_spec.get_axis_ids(row, col, cols)  # Axes du subplot
 
         # Calculer le total des médailles par pays (inclut "Others")
         df['Total'] = df.sum(axis=1, numeric_only=True)
@@ -53,84 +70,83 @@ def create_multiple_heatmaps(data):
         df = df.loc[df.index[::-1]]
 
         # Mapper les codes des pays aux noms complets
-        country_mapping = dict(zip(country_codes['Code'], country_codes['Name']))  # Dictionnaire code -> nom
         y_labels = [country_mapping.get(code, code) for code in df.index]  # Générer les noms complets des pays
-
-        # Créer une heatmap pour le sport courant
-        heatmap = go.Heatmap(
-            z=df.values,  # Valeurs des médailles
-            x=df.columns,  # Années
-            y=y_labels,  # Noms des pays
+        y_pos = np.arange(len(y_labels))  # Position de chaque pays sur l'axe y (numérique)
+
+        # Créer une heatmap pour le sport courant, dans le subplot correspondant
+        traces.append(dict(
+            type="heatmap",
+            z=df.to_numpy(),  # Valeurs des médailles
+            x=df.columns.to_numpy(),  # Années
+            y=y_pos,  # Position des pays
+            text=np.repeat(np.array(y_labels, dtype=object)[:, None], len(df.columns), axis=1),  # Nom du pays de chaque case
             xgap=5,  # Espacement horizontal entre les cases
             ygap=5,  # Espacement vertical entre les cases
-            colorscale="Blues",  # Palette de couleurs
+            colorscale=figure_spec.get_colorscale("Blues"),  # Palette de couleurs
             colorbar=dict(
                 x=0.15 + (col - 1) * 0.29,  # Position horizontale de la barre de couleurs
                 y=0.91 - (row - 1) * (1.10 / rows),  # Position verticale de la barre de couleurs
                 len=0.22  # Hauteur de la barre de couleurs
             ),
-            hovertemplate=hover.get_hover_template(sport)  # Modèle d'informations pour le survol
-        )
-
-        # Ajouter la heatmap au subplot correspondant
-        fig.add_trace(heatmap, row=row, col=col)
-
-        # Ajouter des annotations pour les pays hôtes
-        for year in df.columns:
-            if year in data["Host_Countries"]:  # Vérifier si l'année est dans les pays hôtes
-                host_country = data["Host_Countries"][year]
-                if host_country in df.index:  # Vérifier si le pays hôte est dans les données
-                    y_index = df.index.get_loc(host_country)  # Obtenir l'index du pays hôte
-
-                    # Définir la taille du rectangle
-                    size_x = 1.8
-                    size_y = 0.5
-
-                    # Ajouter un rectangle rouge autour du pays hôte
-                    fig.add_shape(
-                        type="rect",
-                        x0=int(year) - size_x,  # Début de l'année avec une marge
-                        x1=int(year) + size_x,  # Fin de l'année avec une marge
-                        y0=y_index - size_y,  # Début du pays avec une marge
-                        y1=y_index + size_y,  # Fin du pays avec une marge
-                        xref=f"x{i+1}",  # Référence à l'axe x du subplot
-                        yref=f"y{i+1}",  # Référence à l'axe y du subplot
-                        line=dict(color="red", width=2),  # Style du rectangle
-                    )
+            hovertemplate=hover.get_hover_template(sport),  # Modèle d'informations pour le survol
+            xaxis=x_id,
+            yaxis=y_id,
+        ))
+
+        # Axe y numérique, étiqueté avec les noms des pays : les rectangles des pays hôtes
+        # peuvent ainsi être placés par une trace de lignes superposée à la heatmap
+        layout[figure_spec.get_axis_key(y_id)].update(tickvals=y_pos, ticktext=y_labels, zeroline=False)
+
+        # Cases des pays hôtes présents dans la heatmap (année, position du pays)
+        host_cells = [
+            (int(year), df.index.get_loc(host_countries[year]))
+            for year in df.columns
+            if year in host_countries and host_countries[year] in df.index
+        ]
+
+        # Ajouter un rectangle rouge autour de chaque pays hôte : une seule trace par subplot
+        if host_cells:
+            x_lines, y_lines = get_rectangles(*zip(*host_cells), HOST_HALF_WIDTH, HOST_HALF_HEIGHT)
+            traces.append(dict(
+                type="scatter",
+                x=x_lines,
+                y=y_lines,
+                mode="lines",
+                line=dict(color="red", width=2),  # Style des rectangles
+                hoverinfo="skip",
+                showlegend=False,
+                xaxis=x_id,
+                yaxis=y_id,
+            ))
 
     # Ajouter une légende pour le rectangle rouge (pays organisateur)
-    fig.add_trace(
-        go.Scatter(
-            x=[None],  # Valeur fictive pour la légende
-            y=[None],
-            mode="markers",
-            marker=dict(
-                size=12,
-                color="red",
-                symbol="square-open"  # Carré non rempli
-            ),
-            name="Host Country",  # Nom dans la légende
-        )
-    )
+    traces.append(dict(
+        type="scatter",
+        x=[None],  # Valeur fictive pour la légende
+        y=[None],
+        mode="markers",
+        marker=dict(
+            size=12,
+            color="red",
+            symbol="square-open"  # Carré non rempli
+        ),
+        name="Host Country",  # Nom dans la légende
+    ))
 
-    # Mettre à jour la position de la légende pour qu'elle soit affichée en haut
-    fig.update_layout(
+    # Mettre à jour la mise en page globale
+    layout.update(
+        # Position de la légende pour qu'elle soit affichée en haut
         legend=dict(
             orientation="h",  # Légende horizontale
             yanchor="bottom",
             y=1.05,  # Position au-dessus des heatmaps
             xanchor="center",
             x=0.5  # Centrer la légende
-        )
-    )
-
-    # Mettre à jour la mise en page globale
-    fig.update_layout(
-        font=dict(family="Inter"),  # Définir la police "Inter"
-        font_size=14,  # Définir la taille du texte à 14
+        ),
+        font=dict(family="Inter", size=14),  # Définir la police "Inter" et la taille du texte à 14
         height=rows * 370,  # Ajuster la hauteur en fonction du nombre de lignes
         width=cols * 370,  # Ajuster la largeur pour bien afficher les légendes
         showlegend=True,  # Activer la légende globale
     )
 
-    return fig  # Retourner la figure finale
+    return figure_spec.make_figure(traces, layout)  # Retourner la figure finale
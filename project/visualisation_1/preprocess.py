@@ -2,6 +2,7 @@
 import pandas as pd  # Pour manipuler les données sous forme de DataFrame
 import matplotlib.pyplot as plt  # Pour créer des visualisations (non utilisé dans ce code)
 import os  # Pour manipuler les chemins de fichiers
+from project import data_store  # Accès partagé aux données chargées une seule fois
 
 # Fonction pour charger un fichier CSV depuis le dossier 'data'
 def load_csv(filename):
@@ -11,9 +12,6 @@ def load_csv(filename):
     path = os.path.join("data", filename)  # Construit le chemin complet du fichier
     return pd.read_csv(path)  # Charge le fichier CSV dans un DataFrame
 
-# Chargement des données depuis le fichier CSV
-data = load_csv("all_athlete_games.csv")
-
 # Liste des sports d'été
 summer_sports = [
     "Athletics", "Badminton", "Basketball", "Boxing",
@@ -27,51 +25,11 @@ winter_sports = [
     "Figure Skating", "Ice Hockey", "Luge", "Nordic Combined", "Ski Jumping", "Skeleton", "Snowboarding"
 ]
 
-# Dictionnaire associant les villes hôtes des Jeux Olympiques à leurs pays respectifs
-organaizing_countries = {
-    "Albertville": "FRA",
-    "Amsterdam": "NED",
-    "Antwerpen": "BEL",
-    "Athina": "GRE",
-    "Atlanta": "USA",
-    "Barcelona": "ESP",
-    "Beijing": "CHN",
-    "Berlin": "GER",
-    "Calgary": "CAN",
-    "Chamonix": "FRA",
-    "Cortina d'Ampezzo": "ITA",
-    "Garmisch-Partenkirchen": "GER",
-    "Grenoble": "FRA",
-    "Helsinki": "FIN",
-    "Innsbruck": "AUT",
-    "Lake Placid": "USA",
-    "Lillehammer": "NOR",
-    "London": "GBR",
-    "Los Angeles": "USA",
-    "Melbourne": "AUS",
-    "Mexico City": "MEX",
-    "Montreal": "CAN",
-    "Moskva": "RUS",
-    "Munich": "GER",
-    "Nagano": "JPN",
-    "Oslo": "NOR",
-    "Paris": "FRA",
-    "Rio de Janeiro": "BRA",
-    "Roma": "ITA",
-    "Salt Lake City": "USA",
-    "Sankt Moritz": "SUI",
-    "Sapporo": "JPN",
-    "Sarajevo": "BIH",
-    "Seoul": "KOR",
-    "Sochi": "RUS",
-    "Squaw Valley": "USA",
-    "St. Louis": "USA",
-    "Stockholm": "SWE",
-    "Sydney": "AUS",
-    "Tokyo": "JPN",
-    "Torino": "ITA",
-    "Vancouver": "CAN"
-}
+# Nombre de pays affichés individuellement pour chaque sport (les autres sont regroupés sous 'Others')
+TOP_COUNTRIES = 10
+
+# Résultats de convert_data déjà calculés, par saison
+_converted_data = {}
 
 # Fonction pour convertir les données et calculer les médailles par sport et par pays
 def convert_data(season):
@@ -79,55 +37,67 @@ def convert_data(season):
     Convertit les données pour obtenir les médailles par sport et par pays.
     Filtre les données entre 1991 et 2020, puis calcule les médailles pour les
     10 meilleurs pays par sport, en regroupant les autres pays sous 'Others'.
+    Le résultat est calculé une seule fois par saison puis réutilisé : il ne doit pas être modifié.
+    """
+    if season not in _converted_data:
+        _converted_data[season] = _compute_medal_counts(season)
+    return _converted_data[season]
+
+
+def _compute_medal_counts(season):
+    """
+    Calcule en une seule passe, pour tous les sports de la saison, les médailles
+    par pays et par année des 10 meilleurs pays et de la ligne 'Others'.
     """
 
-    # Détermine les sports et filtre les données en fonction de la saison
+    # Récupère le cube partagé des médailles (NOC x Team x Year x Season x City x Sport)
+    data = data_store.get_medal_cube()
+
+    # Détermine les sports et les années en fonction de la saison
     if season == 'Summer':
         sports = summer_sports  # Sports d'été
-        filtered_data = data[(data['Year'] >= 1992) & (data['Year'] <= 2020)]  # Filtre les années pour les JO d'été
+        years = data['Year'].between(1992, 2020)  # Années retenues pour les JO d'été
     else:
         sports = winter_sports  # Sports d'hiver
-        filtered_data = data[(data['Year'] >= 1994) & (data['Year'] <= 2020)]  # Filtre les années pour les JO d'hiver
+        years = data['Year'].between(1994, 2020)  # Années retenues pour les JO d'hiver
+
+    # Médailles par sport, pays (NOC en texte pour le tri alphabétique) et année
+    filtered_data = data[years & data['Sport'].isin(sports)]
+    counts = (
+        filtered_data.assign(Sport=filtered_data['Sport'].astype(str), NOC=filtered_data['NOC'].astype(str))
+        .groupby(['Sport', 'NOC', 'Year'])['Medals'].sum()
+        .reset_index()
+    )
+
+    # Classe les pays de chaque sport par total de médailles décroissant, puis par NOC alphabétique
+    totals = counts.groupby(['Sport', 'NOC'], as_index=False)['Medals'].sum()
+    totals = totals.sort_values(['Sport', 'Medals', 'NOC'], ascending=[True, False, True])
+    totals['Rank'] = totals.groupby('Sport').cumcount()
+
+    # Les pays hors du top 10 de leur sport sont regroupés sous 'Others'
+    totals['Label'] = totals['NOC'].where(totals['Rank'] < TOP_COUNTRIES, 'Others')
+    counts = counts.merge(totals[['Sport', 'NOC', 'Label']], on=['Sport', 'NOC'])
+
+    # Tableau croisé unique (sport, pays) x année pour tous les sports
+    pivot = counts.pivot_table(index=['Sport', 'Label'], columns='Year', values='Medals', aggfunc='sum', fill_value=0)
+    years_by_sport = counts.groupby('Sport')['Year'].unique()  # Années où chaque sport est présent
+    top_by_sport = totals[totals['Rank'] < TOP_COUNTRIES].groupby('Sport')['NOC'].apply(list)  # Top 10 ordonné
 
     medal_counts = {}  # Dictionnaire pour stocker les médailles par sport
 
-    # Parcourt chaque sport pour calculer les médailles
+    # Découpe le tableau croisé par sport, dans l'ordre de la liste des sports
     for sport in sports:
-        # Filtre les données pour un sport spécifique
-        sport_data = filtered_data[filtered_data['Sport'] == sport]
-        if not sport_data.empty:  # Vérifie si les données pour ce sport ne sont pas vides
-            # Groupe par pays (NOC) et année, puis compte les médailles
-            medals_by_country_year = sport_data.groupby(['NOC', 'Year'])['Medal'].count().unstack(fill_value=0)
-            
-            # Trie les pays par le total des médailles (somme sur toutes les années)
-            sorted_medals = medals_by_country_year.sum(axis=1).sort_values(ascending=False)
-
-            # Trie par total des médailles en ordre décroissant, puis par NOC en ordre alphabétique
-            sorted_medals = sorted_medals.sort_index(ascending=True).sort_values(ascending=False, kind='mergesort')
-            
-            # Sélectionne les 10 meilleurs pays
-            top_countries = sorted_medals.head(10).index
-            
-            # Extrait les données pour les 10 meilleurs pays
-            top_countries_data = medals_by_country_year.loc[top_countries]
-
-            # Calcule les médailles pour les pays hors du top 10
-            others_data = medals_by_country_year.drop(top_countries).sum()
-            
-            # Ajoute une ligne 'Others' pour les autres pays
-            top_countries_data.loc['Others'] = others_data
-
-            # Ajoute les données au dictionnaire pour le sport actuel
-            medal_counts[sport] = top_countries_data
-
-    # Ajoute une colonne pour le code du pays organisateur
-    filtered_data['Host_Country'] = filtered_data['City'].map(organaizing_countries)
+        if sport not in years_by_sport.index:  # Sport absent des données
+            continue
+        rows = top_by_sport[sport] + ['Others']
+        sport_years = sorted(years_by_sport[sport])
+        medal_counts[sport] = pivot.loc[sport].reindex(index=rows, columns=sport_years, fill_value=0)
 
     # Crée un dictionnaire avec les années comme clés et les codes des pays organisateurs comme valeurs
-    host_countries_by_year = filtered_data[filtered_data['Season'] == season][['Year', 'Host_Country']].drop_duplicates().sort_values('Year')
-    host_countries_dict = dict(zip(host_countries_by_year['Year'], host_countries_by_year['Host_Country']))
+    editions = data.loc[years & (data['Season'] == season), data_store.EDITION_KEYS].drop_duplicates().sort_values('Year')
+    host_countries_dict = dict(zip(editions['Year'], data_store.get_host_nocs(editions)))
 
     # Ajoute les données des pays organisateurs dans medal_counts
     medal_counts['Host_Countries'] = host_countries_dict
-    
+
     return medal_counts  # Retourne le dictionnaire contenant les médailles par sport et les pays organisateurs
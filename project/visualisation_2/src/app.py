@@ -10,7 +10,7 @@
 '''
 
 # Importation des modules nécessaires pour Dash et Plotly
-from dash import callback
+from dash import clientside_callback
 import dash_html_components as html
 import dash_core_components as dcc
 from dash.dependencies import Input, Output
@@ -20,6 +20,7 @@ import plotly.graph_objects as go
 # Importation des modules personnalisés pour le prétraitement et les graphiques
 import project.visualisation_2.src.preprocess as preprocess
 import project.visualisation_2.src.bubble as bubble
+from project import figure_assets  # Variantes de figures servies en JSON statique
 from pathlib import Path
 import os
 import pandas as pd 
@@ -28,16 +29,17 @@ import pandas as pd
 DATA_FOLDER = Path(os.path.abspath(__file__)).parent
 PATH_PROCESSED_NON_SEASONAL_DATA = DATA_FOLDER / "vis_2_processed_data_1.csv"
 PATH_PROCESSED_SEASONAL_DATA = DATA_FOLDER / "vis_2_processed_data_2.csv"
+SEASON_VARIANTS = ['Summer', 'Winter', 'all']  # Variantes du graphique par climat ('all' : les deux saisons)
 
-# Fonction pour générer une figure Plotly à partir d'un DataFrame
-def generate_fig(df, graph_id: int = 1):
-    # Conversion des colonnes en types numériques
-    df["Population"] = pd.to_numeric(df["Population"] , errors="coerce")
-    df["nb_medals"] = pd.to_numeric(df["nb_medals"] , errors="coerce")
-    df["PIB_per_Capita"] = pd.to_numeric(df["PIB_per_Capita"] , errors="coerce")
+# Fonction pour charger un fichier de données prétraitées, prêt à être affiché
+def load_processed_data(path):
+    df = preprocess.get_df(path)  # Colonnes numériques typées dès la lecture (voir preprocess.SCHEMAS)
+    # Arrondir les décimales une seule fois au chargement
+    return preprocess.round_decimals(df)
 
-    # Arrondir les décimales et trier les données selon le type de graphique
-    df = preprocess.round_decimals(df)
+# Fonction pour générer une figure Plotly à partir d'un DataFrame (sans modifier `df`, partagé entre les requêtes)
+def generate_fig(df, graph_id: int = 1):
+    # Trier les données selon le type de graphique
     if graph_id == 1:
         df = preprocess.sort_dy_by_yr_continent(df)
     else:
@@ -60,27 +62,26 @@ def generate_fig(df, graph_id: int = 1):
 
     return fig
 
-# Chargement des données prétraitées
-non_sesonal_df = preprocess.get_df(PATH_PROCESSED_NON_SEASONAL_DATA)
-seasonal_df = preprocess.get_df(PATH_PROCESSED_SEASONAL_DATA)
+# Chargement des données prétraitées (en lecture seule pour les callbacks)
+non_sesonal_df = load_processed_data(PATH_PROCESSED_NON_SEASONAL_DATA)
+seasonal_df = load_processed_data(PATH_PROCESSED_SEASONAL_DATA)
 
-# Génération des figures pour les deux graphiques
-fig1 = generate_fig(non_sesonal_df, 1)
-fig2 = generate_fig(seasonal_df, 2)
+# Fonction pour générer le premier graphique (médailles par continent)
+def get_continent_figure():
+    return generate_fig(non_sesonal_df, 1)
 
-# Fonction pour mettre à jour le graphique en fonction des saisons sélectionnées
-def update_figure(selected_seasons):
-    # Filtrer les données selon les saisons sélectionnées
-    if len(selected_seasons) == 2:
+# Fonction pour générer le graphique par climat d'une variante : 'Summer', 'Winter' ou 'all' (les deux saisons)
+def get_season_figure(variant):
+    # Filtrer les données selon la saison de la variante
+    if variant == 'all':
         filtered_df = non_sesonal_df
     else:
-        print(selected_seasons)
-        filtered_df = seasonal_df[seasonal_df['Season'] == selected_seasons[0]]
+        filtered_df = seasonal_df[seasonal_df['Season'] == variant]
     
     # Trier les données par climat
     filtered_df = preprocess.sort_dy_by_yr_climate(filtered_df)
 
-    # Recréer le graphique avec les données filtrées
+    # Créer le graphique avec les données filtrées
     fig = bubble.get_plot(filtered_df, 2)
     fig = bubble.update_animation_hover_template(fig)
     fig = bubble.update_animation_menu(fig)
@@ -94,15 +95,44 @@ def update_figure(selected_seasons):
 
     return fig
 
-# Définition du callback pour mettre à jour le graphique en fonction des filtres
-callback(
+# Une variante par combinaison de saisons, construite et sérialisée une seule fois (voir project/figure_assets.py)
+figure_assets.register_figure('viz2-continent', get_continent_figure)
+for variant in SEASON_VARIANTS:
+    figure_assets.register_figure(f'viz2-{variant}', lambda variant=variant: get_season_figure(variant))
+
+# Callback clientside : le premier graphique est chargé lorsque la section devient visible
+clientside_callback(
+    """
+    function(visible) {
+        return window.dash_clientside.figures.load(visible, 'viz2-continent');
+    }
+    """,
+    Output('bubble-graph-1', 'figure'),
+    Input('viz2-visible', 'data')
+)
+
+# Callback clientside : le changement de saisons charge la variante correspondante (voir assets/figures.js)
+clientside_callback(
+    """
+    function(selected_seasons, visible) {
+        if (!selected_seasons || selected_seasons.length === 0) {
+            return window.dash_clientside.no_update;
+        }
+        const variant = selected_seasons.length === 2 ? 'all' : selected_seasons[0];
+        return window.dash_clientside.figures.load(visible, 'viz2-' + variant);
+    }
+    """,
     Output('bubble-graph-2', 'figure'),
-    Input('viz2-season-filter', 'value')
-)(update_figure)
+    Input('viz2-season-filter', 'value'),
+    Input('viz2-visible', 'data')
+)
 
 # Fonction pour générer le HTML de la visualisation
 def get_viz_2_html():
     return html.Div(className='content', children=[
+        # Indique si la section est visible (mis à jour par assets/lazy_sections.js)
+        dcc.Store(id='viz2-visible', data=False),
+
         # Titre et description de la visualisation
         html.Div(children=[
             html.H1('🥇 1. Is Olympic Success Reserved for Superpowers?', 
@@ -137,8 +167,8 @@ def get_viz_2_html():
         html.Div(className='viz-container', 
                  style={'display': 'flex', 'justifyContent': 'center', 'gap': '40px', 'backgroundColor': 'white'}, children=[
             
-            # Premier graphique
-            dcc.Graph(className='graph', figure=fig1, config=dict(
+            # Premier graphique (rempli par le callback quand la section est visible)
+            dcc.Graph(id='bubble-graph-1', className='graph', config=dict(
             scrollZoom=False,
             showTips=False,
             showAxisDragHandles=False,
@@ -162,8 +192,8 @@ def get_viz_2_html():
                 )
             ], style={'marginBottom': '20px', 'textAlign': 'center'}),
 
-            # Deuxième graphique
-            dcc.Graph(id='bubble-graph-2', className='graph', figure=fig2, config=dict(
+            # Deuxième graphique (rempli par le callback quand la section est visible)
+            dcc.Graph(id='bubble-graph-2', className='graph', config=dict(
                 scrollZoom=False,
                 showTips=False,
                 showAxisDragHandles=False,
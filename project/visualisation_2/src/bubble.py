@@ -29,7 +29,8 @@ def get_plot(df, graph_id: int = 1):
     min, max = df['Population'].min(), df['Population'].max()
     
     # Scale marker sizes between 3 and 200 based on population values
-    df['marker_size'] = 3 + ((df['Population'] - min) / (max - min)) * (200 - 3)
+    # (on a copy, so the shared dataframe passed by the callbacks is left untouched)
+    df = df.assign(marker_size=3 + ((df['Population'] - min) / (max - min)) * (200 - 3))
 
     # Create a scatter plot with animation frames for different years
     fig = px.scatter(
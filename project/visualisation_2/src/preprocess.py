@@ -3,68 +3,100 @@
 """
 
 from pathlib import Path
+import logging
 import os
+import numpy as np
 import pandas as pd
-import csv
+from project import data_store  # Accès partagé aux tables typées du dossier 'data'
+
+logger = logging.getLogger(__name__)  # Pays écartés faute de données (journalisés, comme dans project.data_store)
 
 # Définition des chemins vers les fichiers de données
 DATA_FOLDER = Path(os.path.abspath(__file__)).parent.parent.parent.parent / "data"
-PATH_ATHLETE_GAMES = DATA_FOLDER / "all_athlete_games.csv"
-PATH_REGIONS = DATA_FOLDER / "all_regions.csv"
 PATH_PIB_PER_CAPITA = DATA_FOLDER / "WEO_database_Apre2024.csv" # Données provenant du site IMF
 PATH_COUNTRIES_PER_CONTINENT = DATA_FOLDER / "countries_per_continent.csv" # Données provenant du site World Population Review
 PATH_POPULATION_PER_COUNTRY = DATA_FOLDER / "SP_POP_TOTL.csv" # Données provenant du site World Bank
 PATH_AVERAGE_TEMPERATURE_PER_COUNTRY = DATA_FOLDER / "average_temperature_per_country.csv"
 
-# Fonction pour charger un fichier CSV en DataFrame
+YEAR_GROUPS = ["1945-1990", "1991-2020"]  # Groupes d'années comparés dans la visualisation
+PIB_SUBJECT_CODE = "PPPPC"  # Indicateur IMF du PIB par habitant (parité de pouvoir d'achat)
+PIB_MAX_YEAR = 2025  # Dernière année du PIB prise en compte
+WEO_CHUNK_SIZE = 1000  # Nombre de lignes du fichier IMF lues à la fois
+
+# Schéma des données prétraitées : colonnes numériques typées, les textes vides restent vides (affichés tels quels)
+PROCESSED_DATA_SCHEMA = {
+    "dtype": {"Population": "float64", "nb_medals": "float64", "PIB_per_Capita": "float64"},
+    "keep_default_na": False,
+    "na_values": {"Population": [""], "nb_medals": [""], "PIB_per_Capita": [""]},
+}
+
+# Schémas de lecture des fichiers propres à la visualisation 2 (encodage, format des nombres et types).
+# Les autres tables du dossier 'data' sont décrites dans data_store.TABLE_SCHEMAS.
+SCHEMAS = {
+    PATH_PIB_PER_CAPITA.name: {
+        "encoding": "utf-8-sig",  # Fichier UTF-8 avec BOM
+        "thousands": ",",  # Les valeurs sont écrites "12,345.678"
+        "na_values": ["n/a", "--"],  # Valeurs manquantes du fichier IMF
+        "dtype": {"ISO": "category", "WEO Subject Code": "category", "Country": "category"},
+    },
+    "vis_2_processed_data_1.csv": PROCESSED_DATA_SCHEMA,
+    "vis_2_processed_data_2.csv": PROCESSED_DATA_SCHEMA,
+}
+
+# Fonction pour charger un fichier CSV en DataFrame typé, en une seule lecture
 def get_df(path: Path) -> pd.DataFrame:
-    with open(path, encoding="ISO-8859-1") as data_file:
-        data = list(csv.reader(data_file))
-    df = pd.DataFrame(data[1:], columns=data[0])  # Crée un DataFrame avec les colonnes du fichier CSV
-    return df
-
-# Chargement des données des athlètes
+    path = Path(path)
+    if path.parent == data_store.DATA_FOLDER and path.name in data_store.TABLE_SCHEMAS:
+        return data_store.load_table(path.name)  # Table partagée, lue une seule fois avec son schéma
+    return pd.read_csv(path, **SCHEMAS.get(path.name, {}))
+
+# Colonnes des années (par exemple "1992") d'un fichier au format large
+def get_year_columns(columns) -> list:
+    return [col for col in columns if col.isdigit()]
+
+# Groupe d'années de chaque année (calcul vectorisé)
+def get_year_group(years) -> pd.Categorical:
+    years = np.asarray(years)
+    groups = np.where((years >= 1945) & (years <= 1990), "1945-1990", "1991-2020")
+    return pd.Categorical(groups, categories=YEAR_GROUPS)
+
+# Chargement des données des athlètes (table typée partagée)
 def get_athlete_games() -> pd.DataFrame:
-    return get_df(PATH_ATHLETE_GAMES)
-
-# Chargement des données des régions
-def get_regions() -> pd.DataFrame:
-    return get_df(PATH_REGIONS)
-
-# Chargement et transformation des données du PIB par habitant
-def get_pib_per_capita() -> pd.DataFrame:
-    df = get_df(PATH_PIB_PER_CAPITA)
-
-    df["ISO"] = df["ï»¿ISO"]  # Correction du nom de colonne encodé
+    return data_store.get_athlete_games()
 
-    # Transformation des données pour les rendre exploitables
-    df_melted = df.melt(id_vars=["ISO", "WEO Subject Code", "Country", "Subject Descriptor", 
-                              "Subject Notes", "Units", "Scale"],
-                     var_name="Year", value_name="PIB_per_Capita")
+# Chargement du cube partagé des médailles et participations
+def get_medal_cube() -> pd.DataFrame:
+    return data_store.get_medal_cube()
 
-    df_melted["Year"] = pd.to_numeric(df_melted["Year"], errors="coerce")  # Conversion des années en numérique
-    df_melted["PIB_per_Capita"] = df_melted["PIB_per_Capita"].replace({',': ''}, regex=True)  # Suppression des virgules
-    df_melted["PIB_per_Capita"] = pd.to_numeric(df_melted["PIB_per_Capita"], errors="coerce")  # Conversion en numérique
-    
-    # Conversion en entier (en ignorant les erreurs)
-    df_melted["PIB_per_Capita"] = df_melted["PIB_per_Capita"].astype("Int64", errors="ignore")
+# Lecture en continu du fichier IMF : seules les lignes de l'indicateur `subject` sont conservées
+def read_weo_subject(path: Path, subject: str) -> pd.DataFrame:
+    schema = SCHEMAS[PATH_PIB_PER_CAPITA.name]
+    header = pd.read_csv(path, nrows=0, encoding=schema["encoding"]).columns
+    year_columns = [col for col in get_year_columns(header) if int(col) <= PIB_MAX_YEAR]
 
-    # Suppression des valeurs manquantes
-    df_melted = df_melted.dropna(subset=["PIB_per_Capita"])
-    df_melted = df_melted.reset_index(drop=True)
+    # Lecture par blocs des seules colonnes utiles, filtrés au fil de la lecture
+    chunks = pd.read_csv(path, usecols=["ISO", "WEO Subject Code", "Country", *year_columns],
+                         chunksize=WEO_CHUNK_SIZE, **schema)
+    rows = pd.concat([chunk[chunk["WEO Subject Code"] == subject] for chunk in chunks], ignore_index=True)
+    return rows[["ISO", "Country", *year_columns]]
 
-    # Filtrage des données pertinentes
-    df_melted = df_melted[
-        (df_melted["WEO Subject Code"] == "PPPPC") &
-        (df_melted["Year"].notna()) &
-        (df_melted["Year"] <= 2025)
-    ]
-
-    # Création de groupes d'années
-    df_melted["Year_Group"] = df_melted["Year"].apply(lambda x: "1945-1990" if 1945 <= x <= 1990 else "1991-2020")
-    df_melted["Region"] = df_melted["Country"]
-
-    return df_melted[["ISO", "Region", "Year_Group", "Year", "PIB_per_Capita"]]
+# Chargement et transformation des données du PIB par habitant
+def get_pib_per_capita() -> pd.DataFrame:
+    wide = read_weo_subject(PATH_PIB_PER_CAPITA, PIB_SUBJECT_CODE)  # Une ligne par pays, une colonne par année
+    year_columns = get_year_columns(wide.columns)
+
+    # Passage au format long directement depuis les tableaux : une valeur par (pays, année) renseignée
+    values = wide[year_columns].to_numpy(dtype="float64")
+    years = np.array(year_columns, dtype="int16")
+    year_index, country_index = np.nonzero(~np.isnan(values.T))  # Même ordre que le format long (année par année)
+
+    return pd.DataFrame({
+        "ISO": pd.Categorical(wide["ISO"].to_numpy()[country_index]),
+        "Region": pd.Categorical(wide["Country"].to_numpy()[country_index]),
+        "Year_Group": get_year_group(years)[year_index],
+        "Year": years[year_index],
+        "PIB_per_Capita": values[country_index, year_index],
+    })
 
 # Chargement des données des pays par continent
 def get_countries_per_continents():
@@ -75,79 +107,91 @@ def get_countries_per_continents():
 
 # Chargement des données de population par pays
 def get_population_per_country():
-    df = get_df(PATH_POPULATION_PER_COUNTRY)
-    df["Region"] = df["ï»¿Country Name"]
-    df = df.melt(id_vars=["Region"],
+    df = get_df(PATH_POPULATION_PER_COUNTRY)  # Populations déjà numériques
+    df["Region"] = df["Country Name"]
+    df = df.melt(id_vars=["Region"], value_vars=get_year_columns(df.columns),
                     var_name="Year", value_name="Population")
 
-    df["Population"] = pd.to_numeric(df["Population"], errors="coerce")  # Conversion en numérique
-    df["Year"] = pd.to_numeric(df["Year"], errors="coerce")
-    df["Year_Group"] = df["Year"].apply(lambda x: "1945-1990" if 1945 <= x <= 1990 else "1991-2020")
+    df["Year"] = df["Year"].astype(int)  # Conversion des années en numérique
+    df["Year_Group"] = get_year_group(df["Year"])
 
     df = df[["Region", "Year_Group", "Population"]]
     return df
 
 # Chargement des données de température moyenne par pays
 def get_temp_per_country():
-    df = get_df(PATH_AVERAGE_TEMPERATURE_PER_COUNTRY)
+    df = get_df(PATH_AVERAGE_TEMPERATURE_PER_COUNTRY)  # Températures déjà numériques (signe moins décodé)
 
-    df["Average Temperature"] = pd.to_numeric(df["Average Temperature"], errors="coerce")
     df["Climate"] = df["Average Temperature"].apply(
         lambda x: "Hot climate (>25 C)" if x > 25 else ("Moderate climate (5 C-25 C)" if x > 5 else "Cold climate (<=5 C)")
     )
 
     return df[["Region", "Climate"]]
 
+# Identifiant du pays (voir data_store.get_country_ids) de chaque ligne d'une table indexée par nom de pays.
+# Les noms non résolus (agrégats régionaux de la Banque mondiale, territoires...) sont écartés.
+def with_country_id(df: pd.DataFrame, column: str = "Region") -> pd.DataFrame:
+    df = df.assign(CountryId=data_store.get_country_ids(df[column]))
+    return df[df["CountryId"] != data_store.UNKNOWN_COUNTRY].drop(columns=column)
+
 # Génération des données pour les graphiques "médailles vs PIB"
 def generate_data_medals_vs_pib(graph_id: int = 1):
-    athlete_df = get_athlete_games()
+    athlete_df = get_medal_cube()
     athlete_df["Year"] = athlete_df["Year"].astype(int)
 
     # Définition des colonnes pour le groupement
     if graph_id == 1:
-        mean_group_by_columns_athlete = ["Year_Group", "Region"]
+        mean_group_by_columns_athlete = ["Year_Group", "CountryId"]
         group_by_columns_final = ["Year_Group", "continent", "Region", "Population", "Climate", "nb_medals", "PIB_per_Capita"]
     else:
-        mean_group_by_columns_athlete = ["Year_Group", "Region", "Season"]
+        mean_group_by_columns_athlete = ["Year_Group", "CountryId", "Season"]
         group_by_columns_final = ["Year_Group", "continent", "Region", "Population", "Season", "Climate", "nb_medals", "PIB_per_Capita"]
 
-    # Calcul du nombre moyen de médailles par groupe
-    athlete_df = athlete_df.groupby(["Year", "NOC", "Season"]).size().reset_index(name="nb_medals")
-    athlete_df["Year_Group"] = athlete_df["Year"].apply(lambda x: "1945-1990" if 1945 <= x <= 1990 else "1991-2020")
+    # Calcul du nombre moyen de médailles par groupe (participations par édition, depuis le cube)
+    athlete_df = athlete_df.groupby(["Year", "NOC", "Season"], observed=True)["Participants"].sum().reset_index(name="nb_medals")
+    athlete_df["Year_Group"] = get_year_group(athlete_df["Year"])
 
-    athlete_df = athlete_df.merge(get_regions(), on="NOC", how="left")
-    athlete_df = athlete_df.groupby(mean_group_by_columns_athlete)["nb_medals"].mean().reset_index()
+    # Pays de chaque code NOC (plusieurs codes peuvent désigner le même pays, par exemple FRG et GER)
+    athlete_df["CountryId"] = data_store.get_country_ids(athlete_df["NOC"], scheme="NOC")
+    unresolved = set(athlete_df.loc[athlete_df["CountryId"] == data_store.UNKNOWN_COUNTRY, "NOC"].to_numpy(dtype=object))
+    if unresolved:
+        logger.warning("Codes NOC sans pays, ignorés : %s", ", ".join(sorted(unresolved)))
+    athlete_df = athlete_df[athlete_df["CountryId"] != data_store.UNKNOWN_COUNTRY]
+    athlete_df = athlete_df.groupby(mean_group_by_columns_athlete, observed=True)["nb_medals"].mean().reset_index()
 
-    # Fusion avec les données du PIB
-    pib_df = get_pib_per_capita().groupby(["Year_Group", "Region"])["PIB_per_Capita"].mean().reset_index()
-    athlete_pib_df = athlete_df.merge(pib_df, on=["Year_Group", "Region"], how="left")
+    # Fusion avec les données du PIB (jointures sur l'identifiant entier du pays)
+    pib_df = with_country_id(get_pib_per_capita()).groupby(["Year_Group", "CountryId"], observed=True)["PIB_per_Capita"].mean().reset_index()
+    final_df = athlete_df.merge(pib_df, on=["Year_Group", "CountryId"], how="left")
 
     # Fusion avec les données des continents
-    athlete_pib_continent_df = athlete_pib_df.merge(get_countries_per_continents(), on="Region", how="left")
+    continents_df = with_country_id(get_countries_per_continents()).drop_duplicates("CountryId")
+    final_df = final_df.merge(continents_df, on="CountryId", how="left")
 
     # Fusion avec les données de population
-    populations_df = get_population_per_country().groupby(["Year_Group", "Region"])["Population"].mean().reset_index()
-    final_df = athlete_pib_continent_df.merge(populations_df, on=["Year_Group", "Region"], how="left")
+    populations_df = with_country_id(get_population_per_country()).groupby(["Year_Group", "CountryId"], observed=True)["Population"].mean().reset_index()
+    final_df = final_df.merge(populations_df, on=["Year_Group", "CountryId"], how="left")
 
     # Fusion avec les données de température
-    final_df = final_df.merge(get_temp_per_country(), on="Region", how="left")
+    final_df = final_df.merge(with_country_id(get_temp_per_country()).drop_duplicates("CountryId"), on="CountryId", how="left")
 
-    # Calcul du taux de correspondance
-    final_df = final_df.dropna(subset=["continent", "Population", "PIB_per_Capita"])
-    print(f"Final (hit) rate: {(len(final_df)/len(athlete_df)):.2%}")
+    # Nom canonique du pays, affiché par la visualisation
+    final_df["Region"] = data_store.get_countries().reindex(final_df["CountryId"]).to_numpy()
 
-    # Sélection des colonnes finales et export en CSV
-    final_df = final_df[group_by_columns_final]
-    final_df.to_csv(f"vis_2_processed_data_{graph_id}.csv", index=False)
+    # Les pays sans continent, population ou PIB sont écartés : ils sont signalés colonne par colonne
+    required_columns = ["continent", "Population", "PIB_per_Capita"]
+    for column in required_columns:
+        missing = sorted(final_df.loc[final_df[column].isna(), "Region"].unique())
+        if missing:
+            logger.warning("Pays sans %s, ignorés : %s", column, ", ".join(missing))
+    matched_df = final_df.dropna(subset=required_columns)
+    logger.info("Final (hit) rate: %.2f%%", 100 * len(matched_df) / len(final_df))
 
-    return final_df
+    # Sélection des colonnes finales (l'export en CSV est fait par project.data_build)
+    return matched_df[group_by_columns_final]
 
-# Arrondir les valeurs numériques dans un DataFrame
+# Arrondir les valeurs numériques dans un DataFrame (retourne une copie, sans modifier `df`)
 def round_decimals(df):
-    df["Population"] = df["Population"].round(2)
-    df["nb_medals"] = df["nb_medals"].round(0)
-    df["PIB_per_Capita"] = df["PIB_per_Capita"].round(2)
-    return df
+    return df.round({"Population": 2, "nb_medals": 0, "PIB_per_Capita": 2})
 
 # Obtenir la plage (min, max) d'une colonne
 def get_range(col, df):
@@ -157,13 +201,8 @@ def get_range(col, df):
 def sort_dy_by_yr_continent(df):
     return df.sort_values(["Year_Group", "continent"])
 
-# Trier un DataFrame par année et climat
+# Trier un DataFrame par année et climat (retourne une copie, sans modifier `df`)
 def sort_dy_by_yr_climate(df):
     climate_order = ["Hot climate (>25 C)", "Cold climate (<=5 C)", "Moderate climate (5 C-25 C)"]
-    df["Climate"] = pd.Categorical(df["Climate"], categories=climate_order, ordered=True)
+    df = df.assign(Climate=pd.Categorical(df["Climate"], categories=climate_order, ordered=True))
     return df.sort_values(["Year_Group", "Climate"])
-
-# Exécution principale
-if __name__ == "__main__":
-    generate_data_medals_vs_pib(1)
-    generate_data_medals_vs_pib(2)
@@ -1,16 +1,16 @@
 import dash
-from dash import html, dcc, Input, Output, callback
+from dash import html, dcc, Input, Output, clientside_callback
 import project.visualisation_3.preprocess_ete_hiver as preprocess_ete_hiver
 import project.visualisation_3.lolipop as lolipop
+from project import figure_assets  # Variantes de figures servies en JSON statique
 
-# Chargement initial des données
-df = preprocess_ete_hiver.load_csv("all_athlete_games.csv")  # Charge le fichier CSV contenant les données des Jeux Olympiques
-df_filtered = preprocess_ete_hiver.preprocess_data(df, season="Summer")  # Filtre les données pour la saison "Summer" par défaut
-fig = lolipop.create_lollipop_figure(df_filtered, season="Summer")  # Crée une figure lollipop pour la saison "Summer"
+SEASONS = ["Summer", "Winter"]  # Saisons proposées par le filtre
 
 # Fonction pour générer le contenu HTML de la visualisation
 def get_viz_3_html():
     return html.Div([
+        # Indique si la section est visible (mis à jour par assets/lazy_sections.js)
+        dcc.Store(id='viz3-visible', data=False),
         # Titre principal et description de la visualisation
         html.Div([
             html.H1("🏟️ 2. Do Host Nations Really Have an Advantage?", 
@@ -63,8 +63,8 @@ def get_viz_3_html():
                     inputStyle={"margin-right": "5px"}
                 )
             ], style={'textAlign': 'center', 'margin': '20px 20px'}),
-            # Graphique lollipop initial
-            dcc.Graph(id='lollipop-graph', figure=fig)
+            # Graphique lollipop (rempli par le callback quand la section est visible)
+            dcc.Graph(id='lollipop-graph')
         ]),
         # Section supplémentaire avec des observations sur les tendances olympiques
         html.Div([
@@ -90,14 +90,25 @@ def get_viz_3_html():
         )
     ])
 
-# Callback pour mettre à jour le graphique en fonction de la saison sélectionnée
-@callback(
+# Fonction pour construire la figure d'une saison
+def get_season_figure(selected_season):
+    # Données de la saison sélectionnée (calculées une seule fois par saison)
+    df_filtered = preprocess_ete_hiver.get_season_summary(selected_season)
+    # Crée la figure lollipop pour la saison sélectionnée
+    return lolipop.create_lollipop_figure(df_filtered, season=selected_season)
+
+# Une variante de figure par saison, construite une seule fois et mise en cache par le navigateur
+for season in SEASONS:
+    figure_assets.register_figure(f"viz3-{season}", lambda season=season: get_season_figure(season))
+
+# Callback clientside : le changement de saison charge la variante correspondante (voir assets/figures.js)
+clientside_callback(
+    """
+    function(selected_season, visible) {
+        return window.dash_clientside.figures.load(visible, "viz3-" + selected_season);
+    }
+    """,
     Output('lollipop-graph', 'figure'),  # Met à jour la figure du graphique
-    Input('season-filter', 'value')     # Prend la valeur sélectionnée dans le filtre comme entrée
+    Input('season-filter', 'value'),     # Prend la valeur sélectionnée dans le filtre comme entrée
+    Input('viz3-visible', 'data')        # Visibilité de la section
 )
-def update_figure(selected_season):
-    # Filtre les données en fonction de la saison sélectionnée
-    df_filtered = preprocess_ete_hiver.preprocess_data(df, season=selected_season)
-    # Crée une nouvelle figure lollipop pour la saison sélectionnée
-    fig = lolipop.create_lollipop_figure(df_filtered, season=selected_season)
-    return fig  # Retourne la figure mise à jour
@@ -1,22 +1,38 @@
 import project.visualisation_3.hover_template as hover_template
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-from project.visualisation_3.hover_template import get_host_years_by_country, get_hover_template
+import numpy as np
+from project import figure_spec  # Construction des figures sous forme de dictionnaires
+from project.visualisation_3.hover_template import get_hover_template
+from project.visualisation_3.preprocess_ete_hiver import get_host_years_by_country
+
+# Fonction pour construire les coordonnées de plusieurs segments horizontaux dans une seule trace
+def get_segments(x_start, x_end, y):
+    """
+    Retourne les listes x et y décrivant un segment [x_start, x_end] à la hauteur y
+    pour chaque élément, les segments étant séparés par des valeurs None.
+    """
+    x_lines, y_lines = [], []
+    for x0, x1, y0 in zip(x_start, x_end, y):
+        x_lines += [x0, x1, None]
+        y_lines += [y0, y0, None]
+    return x_lines, y_lines
+
 
 # Fonction principale pour créer une figure de type "lollipop"
 def create_lollipop_figure(df, season, top_margin=240):
     # Récupère les années où chaque pays a été hôte pour une saison donnée
     host_years_map = get_host_years_by_country(season)
 
-    # Crée une figure avec plusieurs sous-graphiques (3 lignes, 2 colonnes)
-    fig = make_subplots(
-        rows=3, cols=2, shared_yaxes=False,
+    # Crée la grille des sous-graphiques (3 lignes, 2 colonnes)
+    cols = 2
+    layout = figure_spec.subplot_grid(
+        3, cols,
         vertical_spacing=0.13,  # Espacement vertical entre les sous-graphiques
         horizontal_spacing=0.03  # Espacement horizontal entre les sous-graphiques
     )
 
     # Ajoute des traces factices pour personnaliser la légende
-    fig.add_trace(go.Scatter(
+    traces = [dict(
+        type='scatter',
         x=[None], y=[None],
         mode='lines',
         line=dict(color='black'),
@@ -24,8 +40,8 @@ def create_lollipop_figure(df, season, top_margin=240):
         legendgroup='lines',
         hoverinfo='skip',
         showlegend=True
-    ))
-    fig.add_trace(go.Scatter(
+    ), dict(
+        type='scatter',
         x=[None], y=[None],
         mode='lines',
         line=dict(color='blue'),
@@ -33,8 +49,8 @@ def create_lollipop_figure(df, season, top_margin=240):
         legendgroup='lines',
         hoverinfo='skip',
         showlegend=True
-    ))
-    fig.add_trace(go.Scatter(
+    ), dict(
+        type='scatter',
         x=[None], y=[None],
         mode='markers',
         marker=dict(color='red', size=8),
@@ -42,8 +58,8 @@ def create_lollipop_figure(df, season, top_margin=240):
         legendgroup='points',
         hoverinfo='skip',
         showlegend=True
-    ))
-    fig.add_trace(go.Scatter(
+    ), dict(
+        type='scatter',
         x=[None], y=[None],
         mode='markers',
         marker=dict(color='green', size=8),
@@ -51,7 +67,7 @@ def create_lollipop_figure(df, season, top_margin=240):
         legendgroup='points',
         hoverinfo='skip',
         showlegend=True
-    ))
+    )]
 
     # Définit les métriques et périodes à afficher
     metrics = [
@@ -70,66 +86,76 @@ def create_lollipop_figure(df, season, top_margin=240):
         y_labels = df_period['Team'].tolist()  # Liste des pays
         y_pos = list(range(len(y_labels)))  # Positions sur l'axe Y
 
+        # Années où chaque pays a été hôte pendant la période
+        host_years_str = {}
+        for country in y_labels:
+            host_years = host_years_map.get(period, {}).get(country, [])
+            host_years_str[country] = ", ".join(map(str, host_years)) if host_years else "N/A"
+
         # Boucle sur les métriques (lignes)
         for i, (metric, label_name) in enumerate(metrics):
-            away_vals = df_period[f"{metric}_Away"].tolist()  # Valeurs à l'extérieur
-            host_vals = df_period[f"{metric}_Host"].tolist()  # Valeurs à domicile
+            # Copies modifiables (les vues des DataFrames sont en lecture seule en mode copy-on-write)
+            away_vals = df_period[f"{metric}_Away"].to_numpy(dtype=float, copy=True)  # Valeurs à l'extérieur
+            host_vals = df_period[f"{metric}_Host"].to_numpy(dtype=float, copy=True)  # Valeurs à domicile
             row, col = i + 1, j + 1  # Ligne et colonne du sous-graphe
-
-            # Ajoute les traces pour chaque pays
-            for y_idx, (country, away, host) in enumerate(zip(y_labels, away_vals, host_vals)):
-                color = 'black' if host >= away else 'blue'  # Couleur de la ligne selon l'avantage
-                host_years = host_years_map.get(period, {}).get(country, [])  # Années où le pays a été hôte
-                host_years_str = ", ".join(map(str, host_years)) if host_years else "N/A"
-
-                # Ajuste les valeurs pour éviter les chevauchements
-                delta = 0.001 if metric == "Ratio" else 1
-                if abs(host - away) < delta:
-                    away -= 2 * delta
-                    host += 2 * delta
-
-                away = float(away) if away is not None else 0
-                host = float(host) if host is not None else 0
-
-                # Trace une ligne entre les valeurs à domicile et à l'extérieur
-                fig.add_trace(go.Scatter(
-                    x=[away, host],
-                    y=[y_idx, y_idx],
+            x_id, y_id = figure_spec.get_axis_ids(row, col, cols)  # Axes du sous-graphe
+
+            # Ajuste les valeurs pour éviter les chevauchements
+            home_advantage = host_vals >= away_vals  # Couleur de la ligne selon l'avantage (avant ajustement)
+            delta = 0.001 if metric == "Ratio" else 1
+            overlap = np.abs(host_vals - away_vals) < delta
+            away_vals[overlap] -= 2 * delta
+            host_vals[overlap] += 2 * delta
+
+            # Trace les lignes entre les valeurs à domicile et à l'extérieur : une trace par couleur,
+            # les segments de chaque pays étant séparés par des valeurs None
+            for color, mask in (('black', home_advantage), ('blue', ~home_advantage)):
+                x_lines, y_lines = get_segments(away_vals[mask], host_vals[mask], np.array(y_pos)[mask])
+                traces.append(dict(
+                    type='scatter',
+                    x=x_lines,
+                    y=y_lines,
                     mode='lines',
                     line=dict(color=color),
                     hoverinfo='skip',
-                    showlegend=False
-                ), row=row, col=col)
-
-                # Ajoute un marqueur pour la valeur à l'extérieur
-                fig.add_trace(go.Scatter(
-                    x=[away],
-                    y=[y_idx],
-                    mode='markers',
-                    marker=dict(color='green', size=8),
-                    customdata=[[country]],
-                    hovertemplate=hover_template.get_hover_template(label_name, is_host=False),
-                    showlegend=False
-                ), row=row, col=col)
-
-                # Ajoute un marqueur pour la valeur à domicile
-                fig.add_trace(go.Scatter(
-                    x=[host],
-                    y=[y_idx],
-                    mode='markers',
-                    marker=dict(color='red', size=8),
-                    customdata=[[country, host_years_str]],
-                    hovertemplate=hover_template.get_hover_template(label_name, is_host=True),
-                    showlegend=False
-                ), row=row, col=col)
+                    showlegend=False,
+                    xaxis=x_id,
+                    yaxis=y_id
+                ))
+
+            # Ajoute les marqueurs pour les valeurs à l'extérieur (une seule trace pour tous les pays)
+            traces.append(dict(
+                type='scatter',
+                x=away_vals,
+                y=y_pos,
+                mode='markers',
+                marker=dict(color='green', size=8),
+                customdata=[[country] for country in y_labels],
+                hovertemplate=hover_template.get_hover_template(label_name, is_host=False),
+                showlegend=False,
+                xaxis=x_id,
+                yaxis=y_id
+            ))
+
+            # Ajoute les marqueurs pour les valeurs à domicile, avec les éditions accueillies par chaque pays
+            traces.append(dict(
+                type='scatter',
+                x=host_vals,
+                y=y_pos,
+                mode='markers',
+                marker=dict(color='red', size=8),
+                customdata=[[country, host_years_str[country]] for country in y_labels],
+                hovertemplate=hover_template.get_hover_template(label_name, is_host=True),
+                showlegend=False,
+                xaxis=x_id,
+                yaxis=y_id
+            ))
 
             # Met à jour les axes Y avec les noms des pays
-            fig.update_yaxes(
+            layout[figure_spec.get_axis_key(y_id)].update(
                 tickvals=list(range(len(y_labels))),
                 ticktext=y_labels,
                 side="right" if col == 2 else "left",  # Position des étiquettes
-                row=row,
-                col=col
             )
 
     # Ajoute des annotations pour les titres des métriques
@@ -180,10 +206,9 @@ def create_lollipop_figure(df, season, top_margin=240):
     ]
 
     # Met à jour la mise en page de la figure
-    fig.update_layout(
-        font=dict(family="Inter"),
+    layout.update(
+        font=dict(family="Inter", size=14),  # Police et taille du texte
         height=950,  # Hauteur de la figure
-        font_size=14,  # Taille du texte
         margin=dict(t=top_margin),  # Marge supérieure
         annotations=title_annotations + [
             # Annotations pour les périodes
@@ -218,4 +243,4 @@ def create_lollipop_figure(df, season, top_margin=240):
         )
     )
 
-    return fig  # Retourne la figure finale
\ No newline at end of file
+    return figure_spec.make_figure(traces, layout)  # Retourne la figure finale
\ No newline at end of file
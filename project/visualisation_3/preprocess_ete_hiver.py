@@ -1,6 +1,9 @@
+import numpy as np
 import pandas as pd
 import os
 
+from project import data_store  # Résumé partagé des participations par pays et par édition
+
 def load_csv(filename):
     """
     Loads a CSV file from the 'data' folder.
@@ -10,70 +13,94 @@ def load_csv(filename):
     # Charge le fichier CSV en tant que DataFrame pandas
     return pd.read_csv(path)
 
+PERIODS = ["1945-1991", "1992-2020"]  # Périodes comparées (avant et après la fin de la Guerre froide)
+
+_tagged_editions = None  # Résumé des éditions avec les colonnes Period et IsHost, calculé une seule fois
+_season_summaries = {}  # Données des graphiques lollipop déjà calculées, indexées par saison
+_host_years = {}  # Années accueillies par pays et par période, indexées par saison
+
+def tag_editions(df):
+    """
+    Ajoute au résumé par pays et par édition (voir data_store.get_edition_summary),
+    limité à la période 1945–2020, les colonnes :
+      - Period : période de l'édition (catégorielle, voir PERIODS)
+      - IsHost : True si le pays (NOC) est le pays hôte de l'édition (voir data_store.get_host_editions)
+    """
+    # Filtrer les données pour la période 1945–2020
+    df = df[(df['Year'] >= 1945) & (df['Year'] <= 2020)]
+
+    # Pays hôte de chaque édition (jointure sur l'année et la saison), comparé au pays de la ligne
+    is_host = df['NOC'].to_numpy(dtype=object) == data_store.get_host_nocs(df)
+    # Période de chaque édition (1945-1991 ou 1992-2020)
+    period = pd.Categorical(np.where(df['Year'] <= 1991, PERIODS[0], PERIODS[1]), categories=PERIODS)
+
+    return df.assign(Period=period, IsHost=is_host)
+
+def get_tagged_editions():
+    """
+    Retourne le résumé partagé des éditions avec les colonnes Period et IsHost
+    (voir `tag_editions`), calculé une seule fois par processus.
+    """
+    global _tagged_editions
+    if _tagged_editions is None:
+        _tagged_editions = tag_editions(data_store.get_edition_summary())
+    return _tagged_editions
+
+def get_season_summary(season):
+    """
+    Retourne les données des graphiques lollipop d'une saison (voir `preprocess_data`),
+    calculées une seule fois par saison à partir du résumé étiqueté des éditions.
+    """
+    if season not in _season_summaries:
+        _season_summaries[season] = preprocess_data(get_tagged_editions(), season=season)
+    return _season_summaries[season]
+
+def get_host_years_by_country(season):
+    """
+    Retourne, pour une saison, les années où chaque pays a accueilli les Jeux,
+    par période : {période: {équipe: [années]}}. Calculé une seule fois par saison.
+    """
+    if season not in _host_years:
+        df = get_tagged_editions()
+        hosts = df[df['IsHost'] & (df['Season'] == season)].drop_duplicates(['Period', 'Team', 'Year']).sort_values('Year')
+        _host_years[season] = {
+            period: group.groupby('Team', observed=True)['Year'].apply(list).to_dict()
+            for period, group in hosts.groupby('Period', observed=True)
+        }
+    return _host_years[season]
+
 def preprocess_data(df, season=None):
     """
     Prepares the data for the lollipop charts.
+    `df` is the per-country, per-edition summary tagged with Period and IsHost (see `tag_editions`).
     """
-    # 1. Filtrer les données pour la période 1945–2020 et éventuellement par saison
-    df = df[(df['Year'] >= 1945) & (df['Year'] <= 2020)].copy()
+    # 1. Filtrer éventuellement par saison (quelques centaines de lignes par saison)
     if season:
         # Filtrer les données pour une saison spécifique (été ou hiver)
-        df = df[df['Season'] == season].copy()
-
-    # 2. Associer les villes hôtes aux pays hôtes
-    city_country_map = {
-        # Été
-        "London": "United Kingdom", "Helsinki": "Finland", "Melbourne": "Australia",
-        "Rome": "Italy", "Tokyo": "Japan", "Mexico City": "Mexico",
-        "Munich": "Germany", "Montreal": "Canada", "Moscow": "Russia",
-        "Los Angeles": "United States", "Seoul": "South Korea", "Barcelona": "Spain",
-        "Atlanta": "United States", "Sydney": "Australia", "Athens": "Greece",
-        "Beijing": "China", "Rio de Janeiro": "Brazil",
-        # Hiver
-        "St. Moritz": "Switzerland", "Oslo": "Norway", "Cortina d'Ampezzo": "Italy",
-        "Squaw Valley": "United States", "Innsbruck": "Austria", "Grenoble": "France",
-        "Sapporo": "Japan", "Lake Placid": "United States", "Sarajevo": "Bosnia and Herzegovina",
-        "Calgary": "Canada", "Albertville": "France", "Lillehammer": "Norway",
-        "Nagano": "Japan", "Salt Lake City": "United States", "Turin": "Italy",
-        "Vancouver": "Canada", "Sochi": "Russia", "Pyeongchang": "South Korea"
-    }
-
-    # 3. Ajouter des colonnes nécessaires
-    # Associer chaque ville hôte à son pays hôte
-    df['HostCountry'] = df['City'].map(city_country_map)
-    # Indiquer si une équipe est le pays hôte
-    df['IsHost'] = df['Team'] == df['HostCountry']
-    # Indiquer si un athlète a gagné une médaille
-    df['HasMedal'] = df['Medal'].notna()
-
-    # Fonction pour déterminer la période (1945-1991 ou 1992-2020)
-    def get_period(year):
-        return "1945-1991" if year <= 1991 else "1992-2020"
-
-    # Ajouter une colonne pour la période
-    df['Period'] = df['Year'].apply(get_period)
+        df = df[df['Season'] == season]
 
     # 4. Calculer le nombre moyen d'athlètes par pays / période / IsHost (moyenne par édition)
     athlete_counts = (
-        df.groupby(['Team', 'Year', 'Period', 'IsHost'])['Name']
-        .nunique()  # Compter le nombre d'athlètes uniques
+        df.groupby(['Team', 'Year', 'Period', 'IsHost'], observed=True)['Athletes']
+        .sum()  # Compter le nombre d'athlètes uniques (déjà distincts par édition)
         .reset_index(name='NumAthletesPerEdition')
     )
     athletes_per_group = (
-        athlete_counts.groupby(['Team', 'Period', 'IsHost'])['NumAthletesPerEdition']
+        athlete_counts.groupby(['Team', 'Period', 'IsHost'], observed=True)['NumAthletesPerEdition']
         .mean()  # Calculer la moyenne par groupe
         .reset_index(name='NumAthletes')
     )
 
     # 5. Calculer le nombre moyen de médailles par pays / période / IsHost (moyenne par édition)
     medal_counts = (
-        df[df['HasMedal']]  # Filtrer uniquement les athlètes ayant gagné une médaille
-        .groupby(['Team', 'Year', 'Period', 'IsHost'])['Medal']
-        .count()  # Compter le nombre de médailles
+        df.groupby(['Team', 'Year', 'Period', 'IsHost'], observed=True)['Medals']
+        .sum()  # Compter le nombre de médailles
         .reset_index(name='NumMedalsPerEdition')
     )
+    # Garder uniquement les éditions où au moins une médaille a été gagnée
+    medal_counts = medal_counts[medal_counts['NumMedalsPerEdition'] > 0]
     medals_per_group = (
-        medal_counts.groupby(['Team', 'Period', 'IsHost'])['NumMedalsPerEdition']
+        medal_counts.groupby(['Team', 'Period', 'IsHost'], observed=True)['NumMedalsPerEdition']
         .mean()  # Calculer la moyenne par groupe
         .reset_index(name='NumMedals')
     )
@@ -95,7 +122,8 @@ def preprocess_data(df, season=None):
     pivot = summary.pivot_table(
         index=['Team', 'Period'],  # Index de la table pivot
         columns='IsHost',  # Colonnes basées sur la valeur de 'IsHost'
-        values=['NumAthletes', 'NumMedals', 'Ratio']  # Valeurs à inclure
+        values=['NumAthletes', 'NumMedals', 'Ratio'],  # Valeurs à inclure
+        observed=True  # Ignorer les combinaisons absentes des catégories
     )
 
     # Renommer les colonnes pour plus de clarté
@@ -1,11 +1,14 @@
 import dash
 from dash import dcc, html, Input, Output, callback
+from dash.exceptions import PreventUpdate  # Pour ne rien calculer tant que la section n'est pas visible
 from project.visualisation_4.init import get_output  # Fonction pour obtenir le texte de sortie
 from project.visualisation_4.preprocess import load_csv  # Fonction pour charger un fichier CSV
 
 # Fonction pour générer le contenu HTML de la visualisation
 def get_viz_4_html():
     return html.Div([
+        # Indique si la section est visible (mis à jour par assets/lazy_sections.js)
+        dcc.Store(id='viz4-visible', data=False),
         # Section d'introduction avec un titre et une description
         html.Div([
             html.H1("🌟 3. Can Individual Talent Elevate an Entire Nation?", 
@@ -95,9 +98,13 @@ def get_viz_4_html():
 @callback(
     [Output('discipline-dropdown', 'options'),  # Met à jour les options du dropdown
      Output('discipline-dropdown', 'value')],  # Met à jour la valeur sélectionnée par défaut
-    [Input('season-radio', 'value')]  # Prend en entrée la valeur sélectionnée dans le radio button
+    [Input('season-radio', 'value'),  # Prend en entrée la valeur sélectionnée dans le radio button
+     Input('viz4-visible', 'data')]  # Visibilité de la section
 )
-def update_discipline_dropdown(season):
+def update_discipline_dropdown(season, visible=True):
+    # Ne rien charger tant que la section n'a pas été affichée (les graphiques suivent la discipline choisie)
+    if not visible:
+        raise PreventUpdate
     # Charger le fichier CSV des disciplines correspondant à la saison (par exemple disciplines_summer.csv)
     filename = f"disciplines_{season.lower()}.csv"  # Nom du fichier basé sur la saison
     df_disc = load_csv(filename)  # Chargement du fichier CSV
@@ -1,6 +1,7 @@
 import circlify  # Bibliothèque pour créer des graphiques de cercles imbriqués
-import plotly.graph_objects as go  # Bibliothèque pour créer des graphiques interactifs
-from project.visualisation_4.preprocess import load_csv  # Fonction personnalisée pour charger des fichiers CSV
+from project.visualisation_4.preprocess import load_csv, get_medal_index  # Chargement des CSV et index des médailles
+from project import metrics  # Mesure du cache des dispositions de cercles
+from project import figure_spec  # Construction des figures sous forme de dictionnaires
 from dash import html, dcc  # Composants Dash pour créer des interfaces web
 import math
 import pandas as pd  # Bibliothèque pour manipuler des données tabulaires
@@ -19,33 +20,156 @@ def split_name(full_name):
         last_name = ""
     return first_name, last_name
 
+TAILLE = 450  # Taille du graphique
+ATHLETE_COUNTRY_COL = "pays"  # Colonne du pays dans le fichier des athlètes
+NAME_COL = "nom_norm"  # Nom affiché (prénom et nom de famille)
+FULL_NAME_COL = "nom"  # Nom complet, identique à la colonne Name des données sources
+MEDAL_COL = "médaille"  # Nombre de médailles de l'athlète
+DISC_COL = "discipline"  # Discipline de l'athlète
+
+_circle_layouts = {}  # Disposition des cercles, calculée une seule fois par (saison, pays)
+
+def _compute_circle_layout(season, df_country):
+    """
+    Calcule la disposition des cercles imbriqués des athlètes d'un pays.
+    Retourne une liste de dictionnaires (un par athlète) contenant la position,
+    le rayon, la discipline, l'étiquette et le texte de survol du cercle.
+    """
+    medal_index = get_medal_index()  # Médailles (or, argent, bronze) par athlète, saison et discipline (>= 1992)
+
+    # Construire une liste des athlètes avec leurs informations
+    athletes = []
+    for _, arow in df_country.iterrows():
+        try:
+            medals = float(arow.get(MEDAL_COL, 0))  # Nombre de médailles
+        except:
+            medals = 0.0
+        athletes.append({
+            "name": arow.get(NAME_COL, "Inconnu"),  # Nom de l'athlète
+            "full_name": arow.get(FULL_NAME_COL, arow.get(NAME_COL, "")),  # Nom complet pour l'index des médailles
+            "country": arow.get(ATHLETE_COUNTRY_COL, ""),  # Pays de l'athlète
+            "discipline": arow.get(DISC_COL, "Non renseigné"),  # Discipline
+            "medals": medals  # Nombre de médailles
+        })
+
+    # Trier les athlètes par nombre de médailles décroissant
+    athletes = sorted(athletes, key=lambda x: x["medals"], reverse=True)
+    medal_values = [ath["medals"] for ath in athletes]  # Liste des médailles pour les cercles
+
+    # Générer les cercles imbriqués avec circlify
+    circles = circlify.circlify(
+        medal_values,
+        show_enclosure=False,
+        target_enclosure=circlify.Circle(x=0, y=0, r=1)
+    )
+    circles = sorted(circles, key=lambda c: c.r, reverse=True)  # Trier les cercles par taille
+
+    layout = []
+    for ath, circle in zip(athletes, circles):
+        # Séparer le prénom et le nom de l'athlète
+        first_name, last_name = split_name(ath["name"])
+        # Détail des médailles (or, argent, bronze) de cet athlète, lu dans l'index
+        gold, silver, bronze = medal_index.get((ath["full_name"], season, ath["discipline"]), (0, 0, 0))
+        layout.append({
+            "x": circle.x, "y": circle.y, "r": circle.r,  # Coordonnées et rayon du cercle
+            "discipline": ath["discipline"],
+            # Étiquette avec le nom de famille et le total de médailles
+            "label": f"{last_name}<br>({int(ath['medals'])})",
+            # Texte pour le survol
+            "hover_text": (
+                f"<b>Nom :</b> {last_name}<br>"
+                f"<b>Prénom :</b> {first_name}<br>"
+                f"<b>Pays :</b> {ath['country']}<br>"
+                f"<b>Discipline :</b> {ath['discipline']}<br>"
+                f"<b>Or / Argent / Bronze :</b> {gold} / {silver} / {bronze}"
+            ),
+        })
+    return layout
+
+def get_circle_layout(season, country):
+    """
+    Retourne la disposition des cercles des athlètes d'un pays pour une saison
+    (voir `_compute_circle_layout`), ou une liste vide si aucun athlète n'est trouvé.
+    La disposition ne dépend pas de la discipline : elle est calculée une seule fois
+    puis réutilisée, seule la couleur des cercles change avec la discipline.
+    """
+    key = (season, country)
+    metrics.record_cache("viz4_circle_layouts", key in _circle_layouts)  # Succès ou échec du cache
+    if key not in _circle_layouts:
+        df_athletes_top = load_csv(f"top10_athletes_{season.lower()}.csv")  # Top 10 athlètes
+        # Filtrer les athlètes du pays
+        df_country = df_athletes_top[df_athletes_top[ATHLETE_COUNTRY_COL] == country]
+        _circle_layouts[key] = _compute_circle_layout(season, df_country) if not df_country.empty else []
+    return _circle_layouts[key]
+
+def get_circle_figure(layout, discipline):
+    """
+    Construit la figure des cercles d'un pays à partir de sa disposition,
+    en rouge pour les athlètes de la discipline sélectionnée et en bleu sinon.
+    La figure est décrite directement sous forme de dictionnaire (voir project.figure_spec).
+    """
+    # Déterminer la couleur de chaque cercle (rouge pour la discipline sélectionnée, sinon bleu)
+    colors = ["red" if circle["discipline"].lower() == discipline.lower() else "blue" for circle in layout]
+
+    # Scatter plot invisible pour gérer les survols
+    hover_trace = dict(
+        type="scatter",
+        x=[circle["x"] for circle in layout],
+        y=[circle["y"] for circle in layout],
+        mode="markers",
+        marker=dict(
+            size=[circle["r"] * 200 for circle in layout],
+            color=colors,
+            opacity=0
+        ),
+        hoverinfo="text",
+        hovertext=[circle["hover_text"] for circle in layout],
+        showlegend=False
+    )
+
+    # Axes masqués, de -1.1 à 1.1
+    axis = dict(range=[-1.1, 1.1], showgrid=False, zeroline=False, visible=False)
+
+    # Mise en page du graphique, avec les cercles et leurs étiquettes
+    return figure_spec.make_figure([hover_trace], dict(
+        xaxis=axis,
+        yaxis=dict(axis),
+        width=TAILLE, height=TAILLE,
+        font=dict(family="Inter", size=14),  # Définir la police "Inter" et la taille du texte à 14
+        margin=dict(l=0, r=0, t=0, b=0),
+        plot_bgcolor="white",
+        shapes=[
+            dict(
+                type="circle",
+                xref="x", yref="y",
+                x0=c["x"] - c["r"], y0=c["y"] - c["r"], x1=c["x"] + c["r"], y1=c["y"] + c["r"],
+                line=dict(color=color),
+                fillcolor=color,
+                opacity=0.5
+            )
+            for c, color in zip(layout, colors)
+        ],
+        annotations=[
+            dict(
+                x=c["x"], y=c["y"],
+                text=c["label"],
+                showarrow=False,
+                font=dict(color="white", size=10)
+            )
+            for c in layout
+        ],
+    ))
+
 def get_output(season, discipline):
     """
     Génère une visualisation HTML pour une saison et une discipline données.
     """
     # Charger les données des fichiers CSV
     df_pays = load_csv(f"top10_pays_{season.lower()}.csv")  # Top 10 pays
-    df_athletes_top = load_csv(f"top10_athletes_{season.lower()}.csv")  # Top 10 athlètes
-    all_athletes = load_csv("all_athlete_games.csv")  # Données complètes des athlètes
-
-    # Filtrer les données pour inclure uniquement les années >= 1992
-    if "Year" in all_athletes.columns:
-        all_athletes = all_athletes[all_athletes["Year"] >= 1992]
-    elif "année" in all_athletes.columns:
-        all_athletes = all_athletes[all_athletes["année"] >= 1992]
-    
-    # Définir les noms des colonnes en fonction des fichiers chargés
+
+    # Définir le nom de la colonne des pays en fonction du fichier chargé
     country_col = "pays" if "pays" in df_pays.columns else "NOC"
-    athlete_country_col = "pays"
-    name_col = "nom_norm"
-    medal_col = "médaille"
-    disc_col = "discipline"
-    
-    # Liste pour stocker les composants HTML de sortie
-    output_components = []
-    output_components.append(html.H2(f"Visualisation pour {season} - Discipline sélectionnée : {discipline}"))
-    output_components.append(html.P("Top 10 pays par score :"))
-    
+
     country_components = []  # Liste pour stocker les composants HTML pour chaque pays
     
     # Parcourir les pays du top 10
@@ -54,120 +178,17 @@ def get_output(season, discipline):
         score = row.get("score", row.get("Score", ""))  # Score du pays
         header = html.H3(f"Pays : {country} - Score : {score}")  # En-tête pour le pays
         
-        # Filtrer les athlètes du pays
-        df_country = df_athletes_top[df_athletes_top[athlete_country_col] == country]
-        if df_country.empty:
+        # Disposition des cercles du pays (calculée une seule fois par saison et par pays)
+        layout = get_circle_layout(season, country)
+        if not layout:
             # Si aucun athlète trouvé, afficher un message
             comp = html.Div([header, html.P("Aucun athlète trouvé.")],
                             style={'marginBottom': '40px', 'border': '1px solid #ccc', 'padding': '10px'})
             country_components.append(comp)
             continue
         
-        # Construire une liste des athlètes avec leurs informations
-        athletes = []
-        for _, arow in df_country.iterrows():
-            try:
-                medals = float(arow.get(medal_col, 0))  # Nombre de médailles
-            except:
-                medals = 0.0
-            athletes.append({
-                "name": arow.get(name_col, "Inconnu"),  # Nom de l'athlète
-                "discipline": arow.get(disc_col, "Non renseigné"),  # Discipline
-                "medals": medals  # Nombre de médailles
-            })
-        
-        # Trier les athlètes par nombre de médailles décroissant
-        athletes = sorted(athletes, key=lambda x: x["medals"], reverse=True)
-        medal_values = [ath["medals"] for ath in athletes]  # Liste des médailles pour les cercles
-        
-        # Générer les cercles imbriqués avec circlify
-        circles = circlify.circlify(
-            medal_values,
-            show_enclosure=False,
-            target_enclosure=circlify.Circle(x=0, y=0, r=1)
-        )
-        circles = sorted(circles, key=lambda c: c.r, reverse=True)  # Trier les cercles par taille
-        
-        TAILLE = 450  # Taille du graphique
-        fig = go.Figure()  # Créer une figure Plotly
-        fig.update_xaxes(range=[-1.1, 1.1], showgrid=False, zeroline=False, visible=False)  # Configurer l'axe X
-        fig.update_yaxes(range=[-1.1, 1.1], showgrid=False, zeroline=False, visible=False)  # Configurer l'axe Y
-        
-        # Variables pour les données du graphique
-        x_scatter, y_scatter, hover_text_list, marker_sizes, marker_color_list = [], [], [], [], []
-        for ath, circle in zip(athletes, circles):
-            # Séparer le prénom et le nom de l'athlète
-            first_name, last_name = split_name(ath["name"])
-            total_medals = int(ath["medals"])  # Total des médailles
-            # Déterminer la couleur du cercle (rouge pour la discipline sélectionnée, sinon bleu)
-            color = "red" if ath["discipline"].lower() == discipline.lower() else "blue"
-            x, y, r = circle.x, circle.y, circle.r  # Coordonnées et rayon du cercle
-            
-            # Ajouter un cercle à la figure
-            fig.add_shape(
-                type="circle",
-                xref="x", yref="y",
-                x0=x - r, y0=y - r, x1=x + r, y1=y + r,
-                line_color=color,
-                fillcolor=color,
-                opacity=0.5
-            )
-            # Ajouter une annotation avec le nom de famille et le total de médailles
-            fig.add_annotation(
-                x=x, y=y,
-                text=f"{last_name}<br>({total_medals})",
-                showarrow=False,
-                font=dict(color="white", size=10)
-            )
-            
-            # Calculer les détails des médailles pour cet athlète
-            df_ath = all_athletes[
-                (all_athletes["Name"] == ath["name"]) &
-                (all_athletes["Season"] == season) &
-                (all_athletes["Sport"] == ath["discipline"])
-            ]
-            # Calculer le total des médailles (or, argent, bronze)
-            total = int((df_ath["Medal"] == "Gold").sum() + (df_ath["Medal"] == "Silver").sum() + (df_ath["Medal"] == "Bronze").sum())
-            # Texte pour le survol
-            hover_text = (
-                f"<b>Nom :</b> {last_name}<br>"
-                f"<b>Prénom :</b> {first_name}<br>"
-                f"<b>Pays :</b> {country}<br>"
-                f"<b>Discipline :</b> {ath['discipline']}"
-            )
-            # Ajouter les données pour le scatter plot
-            x_scatter.append(x)
-            y_scatter.append(y)
-            hover_text_list.append(hover_text)
-            marker_sizes.append(r * 200)
-            marker_color_list.append(color)
-        
-        # Ajouter un scatter plot invisible pour gérer les survols
-        fig.add_trace(go.Scatter(
-            x=x_scatter,
-            y=y_scatter,
-            mode='markers',
-            marker=dict(
-                size=marker_sizes,
-                color=marker_color_list,
-                opacity=0
-            ),
-            hoverinfo='text',
-            hovertext=hover_text_list,
-            showlegend=False
-        ))
-        
-        # Configurer la mise en page du graphique
-        fig.update_layout(
-            width=TAILLE, height=TAILLE,
-            font=dict(family="Inter"),  # Définir la police "Inter"
-            font_size=14,  # Définir la taille du texte à 14
-            margin=dict(l=0, r=0, t=0, b=0),
-            plot_bgcolor="white"
-        )
-        
-        # Créer un composant HTML pour le graphique
-        graph_component = dcc.Graph(figure=fig)
+        # Créer un composant HTML pour le graphique, recoloré selon la discipline
+        graph_component = dcc.Graph(figure=get_circle_figure(layout, discipline))
         comp = html.Div([header, graph_component],
                         style={'marginBottom': '40px', 'border': '1px solid #ccc', 'padding': '10px', 'width': f'{TAILLE}px'})
         country_components.append(comp)
@@ -1,10 +1,11 @@
 # preprocess.py
-import pandas as pd
-import os
+from project import data_store  # Accès partagé aux données chargées une seule fois
 
 def load_csv(filename):
     """
-    Charge un fichier CSV depuis le dossier 'data'.
+    Charge un fichier CSV : la table des participations depuis le dossier 'data',
+    les tables dérivées depuis le dossier 'data/derived' (une seule fois par processus).
     """
-    path = os.path.join("data", filename)
-    return pd.read_csv(path)
+    if filename == data_store.ATHLETE_GAMES_FILE:
+        return data_store.get_athlete_games()
+    return data_store.load_derived(filename)
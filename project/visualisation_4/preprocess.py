@@ -1,15 +1,36 @@
 # preprocess.py
-import pandas as pd  # Importation de la bibliothèque pandas pour la manipulation des données.
-import os  # Importation du module os pour interagir avec le système de fichiers.
+from project import data_store  # Accès partagé aux données chargées une seule fois
+
+_medal_index = None  # Index des médailles par athlète, construit une seule fois par processus
 
 def load_csv(filename):
     """
-    Charge un fichier CSV depuis le dossier 'data'.
+    Charge une table dérivée depuis le dossier 'data/derived'.
+    Le fichier n'est lu qu'une seule fois par processus (voir project.data_store).
     :param filename: Nom du fichier CSV à charger.
     :return: Un DataFrame pandas contenant les données du fichier CSV.
     """
-    # Construction du chemin complet vers le fichier en combinant le dossier 'data' et le nom du fichier.
-    path = os.path.join("data", filename)
-    
-    # Lecture du fichier CSV à l'aide de pandas et retour du DataFrame résultant.
-    return pd.read_csv(path)
+    # Lecture unique du fichier, les appels suivants réutilisent la table en mémoire.
+    return data_store.load_derived(filename)
+
+def _compute_medal_index():
+    """
+    Indexe le détail des médailles d'or, d'argent et de bronze de chaque athlète par
+    saison et par discipline (voir data_store.get_medal_breakdown, à partir de 1992).
+    """
+    breakdown = data_store.get_medal_breakdown()  # Table partagée, lue depuis l'artefact du build
+    keys = zip(breakdown["nom"], breakdown["saison"], breakdown["discipline"])
+    counts = breakdown[["gold", "silver", "bronze"]].to_numpy()
+    # Dictionnaire {(nom, saison, discipline): (or, argent, bronze)}
+    return {key: tuple(int(count) for count in row) for key, row in zip(keys, counts)}
+
+def get_medal_index():
+    """
+    Retourne l'index {(nom, saison, discipline): (or, argent, bronze)} des médailles
+    de chaque athlète. L'index est calculé au premier appel puis réutilisé.
+    """
+    global _medal_index
+    if _medal_index is None:
+        # Assignation en une fois : un autre thread ne voit jamais un index partiel
+        _medal_index = _compute_medal_index()
+    return _medal_index
@@ -1,30 +1,33 @@
 # Importation des bibliothèques nécessaires
 import dash  # Framework pour créer des applications web interactives
-from dash import html, dcc, Dash, callback  # Composants de Dash pour créer l'interface utilisateur
+from dash import html, dcc, Dash, callback, clientside_callback  # Composants de Dash pour créer l'interface utilisateur
 import plotly.graph_objects as go  # Pour créer des graphiques personnalisés
 import plotly.express as px  # Pour créer des graphiques simples et rapides
-from dash.dependencies import Input, Output  # Pour gérer les interactions utilisateur
+from dash.dependencies import Input, Output, State  # Pour gérer les interactions utilisateur
+from dash.exceptions import PreventUpdate  # Pour ne rien calculer tant que la section n'est pas visible
 
 # Importation des modules internes pour le prétraitement et la génération de graphiques
 import project.visualisation_5.preprocess as preprocess  # Module pour charger et préparer les données
 import project.visualisation_5.slopechart as slopechart  # Module pour créer des graphiques en pente
-
-# Chargement des données depuis un fichier CSV
-df = preprocess.load_csv("all_athlete_games.csv")  # Chargement des données des Jeux Olympiques
+from project import figure_assets  # Variantes de figures servies en JSON statique
 
 # Initialisation des valeurs par défaut pour le pays et la saison
 pays = "USA"  # Pays par défaut
 season = "ete"  # Saison par défaut (été)
 
-# Génération initiale du graphique en pente (slopechart) pour les valeurs par défaut
-fig = slopechart.viz_5(df, pays, season)  # Création du graphique pour le pays et la saison par défaut
-
 # Liste des pays disponibles pour la sélection dans le menu déroulant
 pays_disponibles = preprocess.pays_dispo  # Liste des pays disponibles, extraite via le module preprocess
 
+# Une variante de figure par pays et par saison, construite une seule fois et mise en cache par le navigateur
+for code, _ in pays_disponibles:
+    for saison in ("ete", "hiver"):
+        figure_assets.register_figure(f"viz5-{code}-{saison}", lambda code=code, saison=saison: slopechart.viz_5(code, saison))
+
 # Fonction pour générer le contenu HTML de la visualisation
 def get_viz_5_html():
     return html.Div([
+        # Indique si la section est visible (mis à jour par assets/lazy_sections.js)
+        dcc.Store(id='viz5-visible', data=False),
         html.Div(
             html.P([
                 "A closer look at Olympic rankings reveals stark differences in athletic performance across countries. "
@@ -123,13 +126,33 @@ def get_viz_5_html():
         )
     ], style={'textAlign': 'center'})  # Centrer tout le contenu
 
-# Callback pour mettre à jour le graphique en fonction des sélections utilisateur
-@callback(
+# Callback clientside : le changement de saison charge la variante correspondante (voir assets/figures.js)
+clientside_callback(
+    """
+    function(season, visible, pays) {
+        if (!pays) {
+            return window.dash_clientside.no_update;
+        }
+        return window.dash_clientside.figures.load(visible, "viz5-" + pays + "-" + season);
+    }
+    """,
     Output('slopechart', 'figure'),  # Sortie : le graphique à mettre à jour
-    [Input('dropdown-pays', 'value'),  # Entrée : pays sélectionné
-     Input('viz5-season-toggle', 'value')]  # Entrée : saison sélectionnée
+    [Input('viz5-season-toggle', 'value'),  # Entrée : saison sélectionnée
+     Input('viz5-visible', 'data')],  # Entrée : visibilité de la section
+    State('dropdown-pays', 'value')  # Pays sélectionné
+)
+
+# Callback pour mettre à jour le graphique lorsque le pays sélectionné change
+@callback(
+    Output('slopechart', 'figure', allow_duplicate=True),  # Sortie : le graphique à mettre à jour
+    Input('dropdown-pays', 'value'),  # Entrée : pays sélectionné
+    [State('viz5-season-toggle', 'value'),  # Saison sélectionnée
+     State('viz5-visible', 'data')],  # Visibilité de la section
+    prevent_initial_call=True  # La figure initiale est chargée par le callback clientside
 )
-def update_slopechart(pays, season):
-    # Génération du graphique en pente avec les nouvelles valeurs
-    fig = slopechart.viz_5(df, pays, season)  # Mise à jour du graphique avec les nouvelles sélections
-    return fig  # Retourne le graphique mis à jour
\ No newline at end of file
+def update_slopechart(pays, season, visible=True):
+    # Ne pas construire la figure tant que la section n'a pas été affichée ou sans pays sélectionné
+    if not visible or not pays:
+        raise PreventUpdate
+    # Mise à jour partielle : seuls les points, le nom du pays et le titre changent avec le pays
+    return slopechart.get_country_patch(pays, season)
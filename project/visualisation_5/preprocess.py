@@ -2,6 +2,13 @@ import pandas as pd
 import numpy as np
 import os
 
+from project import data_store  # Accès partagé aux données chargées une seule fois
+from project import metrics  # Mesure du cache des tables de points
+
+MIN_YEAR = 1991  # Année minimale conservée pour la visualisation
+
+_points_tables = {}  # Tables des points par pays, calculées une seule fois par saison
+
 def load_csv(filename):
     """
     Charge un fichier CSV depuis le dossier 'data'.
@@ -9,8 +16,6 @@ def load_csv(filename):
     path = os.path.join("data", filename)  # Construit le chemin complet vers le fichier CSV
     return pd.read_csv(path)  # Charge le fichier CSV dans un DataFrame
 
-data = load_csv("all_athlete_games.csv")  # Charge les données du fichier CSV spécifié
-
 
 def rejet_annees(data, annee_inf, ete=True):
     """
@@ -24,7 +29,8 @@ def rejet_annees(data, annee_inf, ete=True):
     Returns:
         -`data`: DataFrame sans les lignes rejetées
     """
-    data["Year"] = data["Year"].astype("Int64")  # Convertit la colonne "Year" en entier nullable
+    # Convertit la colonne "Year" en entier nullable, sans modifier le DataFrame reçu
+    data = data.assign(Year=data["Year"].astype("Int64"))
 
     if ete:
         data = data[data["Season"] == "Summer"]  # Filtre pour les Jeux d'été
@@ -37,6 +43,7 @@ def rejet_annees(data, annee_inf, ete=True):
 def points(data):
     """
     Ajoute une colonne "Medals" et une colonne "Points" au dataframe.
+    Le DataFrame reçu n'est pas modifié : une copie avec les nouvelles colonnes est retournée.
     ---
     Arguments:
         -`data`: DataFrame
@@ -44,18 +51,13 @@ def points(data):
     Returns:
         -`data`: DataFrame avec les nouvelles colonnes
     """
-    # Ajoute une colonne "Medals" avec 1 pour les médailles et 0 sinon
-    data.loc[data["Medal"].isin(["Gold", "Silver", "Bronze"]), "Medals"] = 1
-    data["Medals"] = data["Medals"].fillna(0).astype(int)  # Remplit les valeurs manquantes avec 0
+    # Points attribués selon le type de médaille (3 pour l'or, 2 pour l'argent, 1 pour le bronze)
+    medal_points = data["Medal"].map({"Gold": 3, "Silver": 2, "Bronze": 1}).astype(float).fillna(0).astype(int)
 
-    # Ajoute une colonne "Points" avec des scores basés sur le type de médaille
-    data["Points"] = np.nan  # Initialise la colonne avec des valeurs NaN
-    data.loc[data["Medal"] == "Gold", "Points"] = 3  # 3 points pour l'or
-    data.loc[data["Medal"] == "Silver", "Points"] = 2  # 2 points pour l'argent
-    data.loc[data["Medal"] == "Bronze", "Points"] = 1  # 1 point pour le bronze
-    data["Points"] = data["Points"].fillna(0).astype(int)  # Remplit les NaN avec 0 et convertit en entier
-
-    return data
+    return data.assign(
+        Medals=(medal_points > 0).astype(int),  # 1 pour les médailles et 0 sinon
+        Points=medal_points,  # 0 pour les athlètes non médaillés
+    )
 
 
 def data_without(data):
@@ -94,10 +96,10 @@ def pays_points(data_with, data_without):
     data_without_unique = data_without.drop_duplicates(subset=["Event", "Team", "Year", "Medal"])
 
     # Calcule les points et médailles par pays et par année pour les deux ensembles de données
-    df_points_with = data_with_unique.groupby(['NOC', 'Year'])[['Points', "Medals"]].sum().reset_index()
+    df_points_with = data_with_unique.groupby(['NOC', 'Year'], observed=True)[['Points', "Medals"]].sum().reset_index()
     df_points_with.columns = ['Country', 'Year', 'Points with', "Medals with"]
 
-    df_points_without = data_without_unique.groupby(['NOC', 'Year'])[['Points', "Medals"]].sum().reset_index()
+    df_points_without = data_without_unique.groupby(['NOC', 'Year'], observed=True)[['Points', "Medals"]].sum().reset_index()
     df_points_without.columns = ['Country', 'Year', 'Points without', "Medals without"]
 
     # Fusionne les deux DataFrames sur les colonnes 'Country' et 'Year'
@@ -106,21 +108,54 @@ def pays_points(data_with, data_without):
     return df_merged
 
 
+def get_points_table(season):
+    """
+    Retourne, pour une saison ("ete" ou "hiver"), la table des points et médailles
+    de tous les pays avec et sans les athlètes multi-médaillés, indexée par pays,
+    ainsi que la liste triée des années. Le calcul n'est fait qu'une seule fois par saison.
+    ---
+    Arguments:
+        -`season`: str: Saison ("ete" pour les Jeux d'été, sinon Jeux d'hiver)
+    
+    Returns:
+        -`df_final`: DataFrame des points par pays (index) et par année
+        -`years`: list: Liste des années
+    """
+    ete = season == "ete"  # Seules deux tables existent : été et hiver
+    metrics.record_cache("viz5_points_tables", ete in _points_tables)  # Succès ou échec du cache
+    if ete not in _points_tables:
+        # Filtrer les données pour les années à partir de MIN_YEAR et selon la saison
+        df_years = rejet_annees(data_store.get_athlete_games(), MIN_YEAR, ete=ete)
+        # Extraire et trier les années uniques
+        years = sorted(df_years["Year"].unique())
+        # Calculer les points pour chaque pays
+        df_points = points(df_years)
+        # Obtenir les données sans les athlètes multi-médaillés
+        df_without = data_without(df_points)
+        # Ajouter les points des pays avec et sans athlètes multi-médaillés
+        df_final = pays_points(df_points, df_without)
+        # Indexer par pays pour une recherche directe lors d'un changement de pays
+        _points_tables[ete] = (df_final.set_index("Country"), years)
+    return _points_tables[ete]
+
+
 def get_usefull_dataframe(df_final, pays, years):
     """
     Crée un DataFrame structuré pour visualiser les points d'un pays donné.
     ---
     Arguments:
-        -`df_final`: DataFrame contenant les points par pays et par année
+        -`df_final`: DataFrame contenant les points par pays (index) et par année
         -`pays`: str: Code du pays (NOC)
         -`years`: list: Liste des années
     
     Returns:
         -`df`: DataFrame structuré pour la visualisation
     """
+    # Récupère les lignes du pays spécifié dans l'index
+    df_pays = df_final.loc[[pays]] if pays in df_final.index else df_final.iloc[:0]
     # Récupère les points "avec" et "sans" pour le pays spécifié
-    points_with = df_final[df_final["Country"] == pays]["Points with"].values
-    points_without = df_final[df_final["Country"] == pays]["Points without"].values
+    points_with = df_pays["Points with"].values
+    points_without = df_pays["Points without"].values
 
     # Crée un DataFrame structuré pour la visualisation
     df = pd.DataFrame({
@@ -1,4 +1,5 @@
 import plotly.express as px
+from dash import Patch  # Pour les mises à jour partielles de la figure
 
 # Importation des modules de prétraitement et de gestion des templates pour les infobulles
 import project.visualisation_5.preprocess as preprocess
@@ -8,18 +9,17 @@ import project.visualisation_5.hover_template as hover_template
 pays_disponibles = preprocess.pays_dispo
 
 
-def viz_5(df, pays, season):
+def get_title(full_pays):
+    """
+    Retourne le titre du graphique pour un pays (nom complet).
+    """
+    return str(full_pays + " points with and without multi-medalists athletes")
+
+
+def viz_5(pays, season):
     ## Prétraitement des données :
-    # Filtrer les données pour les années à partir de 1991 et selon la saison (été ou hiver)
-    df_years = preprocess.rejet_annees(df, 1991, ete=(season == "ete"))
-    # Extraire et trier les années uniques
-    years = sorted(df_years["Year"].unique())
-    # Calculer les points pour chaque pays
-    df_points = preprocess.points(df_years)
-    # Obtenir les données sans les athlètes multi-médaillés
-    df_without = preprocess.data_without(df_points)
-    # Ajouter les points des pays avec et sans athlètes multi-médaillés
-    df_final = preprocess.pays_points(df_points, df_without)
+    # Table des points de tous les pays pour la saison (calculée une seule fois par saison)
+    df_final, years = preprocess.get_points_table(season)
     # Obtenir un DataFrame utile pour la visualisation en fonction du pays et des années
     usefull_df = preprocess.get_usefull_dataframe(df_final, pays, years)
 
@@ -35,7 +35,7 @@ def viz_5(df, pays, season):
         color="Year",
         color_discrete_sequence=px.colors.sequential.Blues[1:],  # Palette de couleurs
         markers=True,  # Ajouter des marqueurs sur les lignes
-        title=str(full_pays + " points with and without multi-medalists athletes"),  # Titre du graphique
+        title=get_title(full_pays),  # Titre du graphique
         hover_data={"Year": True, "Type": True}  # Données affichées dans les infobulles
     )
 
@@ -80,12 +80,38 @@ def viz_5(df, pays, season):
         ticktext=["With multi medalists", "Without multi medalists"]  # Texte des ticks
     )
 
-    # Personnalisation des infobulles pour chaque trace
+    # Personnalisation des infobulles pour chaque trace (le nom du pays est porté par `meta`)
     for trace in fig.data:
-        trace.hovertemplate = hover_template.get_hovertemplate(pays)
+        trace.hovertemplate = hover_template.get_hovertemplate()
+        trace.meta = full_pays
     
     # Personnalisation des lignes (épaisseur)
     fig.update_traces(line=dict(width=2))
 
     # Retourner la figure finale
     return fig
+
+
+def get_country_patch(pays, season):
+    """
+    Retourne une mise à jour partielle (Patch) de la figure de `viz_5` pour un
+    changement de pays, la saison restant la même : seuls les points de chaque
+    année, le nom du pays affiché dans les infobulles et le titre sont remplacés.
+    """
+    # Table des points de tous les pays pour la saison (calculée une seule fois par saison)
+    df_final, years = preprocess.get_points_table(season)
+    # Points "avec" (premières lignes) puis "sans" (lignes suivantes) pour chaque année
+    points = preprocess.get_usefull_dataframe(df_final, pays, years)["Points"].tolist()
+    n_years = len(years)
+
+    # Nom complet du pays
+    _, full_pays = preprocess.is_value_in_tuples(pays, pays_disponibles)
+
+    patched_fig = Patch()
+    # Une trace par année (même ordre que dans `viz_5`), avec les points "avec" et "sans"
+    for i in range(n_years):
+        patched_fig["data"][i]["y"] = [points[i], points[i + n_years]]
+        patched_fig["data"][i]["meta"] = full_pays  # Nom du pays affiché dans les infobulles
+    patched_fig["layout"]["title"]["text"] = get_title(full_pays)
+
+    return patched_fig
@@ -0,0 +1,26 @@
+"""
+Tests du nom affiché des athlètes (project.data_build.normalize_name).
+Lancement depuis la racine du projet : python -m pytest -q
+"""
+
+import pytest
+
+from project.data_build import normalize_name
+
+
+@pytest.mark.parametrize(
+    "full_name, expected",
+    [
+        ("Michael Fred Phelps, II", "Michael Phelps"),  # Suffixe générationnel
+        ("Gary Wayne Hall, Jr.", "Gary Hall"),
+        ("John Smith, Sr.", "John Smith"),
+        ("Peter Paul Jones III", "Peter Jones"),
+        ('Jennifer Elisabeth "Jenny" Thompson (-Cumpelik)', "Jennifer Thompson"),  # Surnom et nom d'épouse
+        ('"Guus" Vogels', "Vogels"),  # Surnom en premier mot
+        ("Ryan Steven Lochte", "Ryan Lochte"),
+        ("Lee Seung-Hun", "Lee Seung-Hun"),
+        ("Madonna", "Madonna"),
+    ],
+)
+def test_normalize_name(full_name, expected):
+    assert normalize_name(full_name) == expected